@@ -26,7 +26,7 @@ class Solution:
     Attributes:
         name: Имя объекта
         coordinate: Координаты объекта
-        children: Список дочерних объектов
+        children: Дочерние объекты по id (в порядке добавления)
         parent: Родительский объект
         id: Уникальный идентификатор
         visible: Видимость объекта
@@ -50,7 +50,7 @@ class Solution:
     def __init__(self, name: str = "Solution", coordinate: Optional[SolutionCoordinate] = None):
         self.name = name
         self.coordinate = coordinate or SolutionCoordinate()
-        self.children: List['Solution'] = []
+        self.children: Dict[str, 'Solution'] = {}
         self.parent: Optional['Solution'] = None
         self.id = self._generate_id()
         self.visible = True
@@ -62,7 +62,7 @@ class Solution:
     
     def _generate_id(self) -> str:
         """Генерирует уникальный идентификатор"""
-        return str(uuid.uuid4())
+        return uuid.uuid4().hex
     
     # Свойства для прямого доступа к координатам
     @property
@@ -116,25 +116,25 @@ class Solution:
     # Методы управления иерархией
     def add_child(self, child: 'Solution'):
         """Добавляет дочерний объект"""
-        if child in self.children:
+        if child.id in self.children:
             return
         
         # Удаляем из предыдущего родителя
         if child.parent:
-            child.parent.children.remove(child)
+            child.parent.children.pop(child.id, None)
         
         child.parent = self
-        self.children.append(child)
+        self.children[child.id] = child
     
     def remove_child(self, child: 'Solution'):
         """Удаляет дочерний объект"""
-        if child in self.children:
-            self.children.remove(child)
+        if self.children.get(child.id) is child:
+            del self.children[child.id]
             child.parent = None
     
     def get_children(self) -> List['Solution']:
         """Возвращает список дочерних объектов"""
-        return self.children.copy()
+        return list(self.children.values())
     
     def get_parent(self) -> Optional['Solution']:
         """Возвращает родительский объект"""
@@ -159,9 +159,12 @@ class Solution:
     def get_descendants(self) -> List['Solution']:
         """Возвращает список всех потомков"""
         descendants = []
-        for child in self.children:
-            descendants.append(child)
-            descendants.extend(child.get_descendants())
+        # Обход в глубину без рекурсии (порядок тот же: потомок, затем его дети)
+        stack = list(reversed(self.children.values()))
+        while stack:
+            node = stack.pop()
+            descendants.append(node)
+            stack.extend(reversed(node.children.values()))
         return descendants
     
     # Методы работы с координатами
@@ -191,6 +194,26 @@ class Solution:
         parent_coord = self.parent.get_absolute_coordinate()
         return self._combine_coordinates(parent_coord, self.coordinate)
     
+    def compute_absolute_coordinates_batch(self) -> Dict[str, SolutionCoordinate]:
+        """
+        Абсолютные координаты объекта и всех его потомков за один проход
+        
+        Каждый узел комбинируется с уже посчитанным родителем, поэтому
+        подъем к корню выполняется только один раз, а не для каждого потомка.
+        
+        Returns:
+            Словарь {id объекта: абсолютные координаты}
+        """
+        result = {self.id: self.get_absolute_coordinate()}
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            node_coord = result[node.id]
+            for child in node.children.values():
+                result[child.id] = self._combine_coordinates(node_coord, child.coordinate)
+                stack.append(child)
+        return result
+    
     def _combine_coordinates(self, parent: SolutionCoordinate, child: SolutionCoordinate) -> SolutionCoordinate:
         """Комбинирует координаты родителя и дочернего объекта"""
         # Простое сложение позиций
@@ -263,7 +286,7 @@ class Solution:
         new_obj.properties = self.properties.copy()
         
         # Копируем дочерние объекты
-        for child in self.children:
+        for child in self.children.values():
             new_obj.add_child(child.copy())
         
         return new_obj
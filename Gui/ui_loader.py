@@ -7,17 +7,101 @@
 
 import os
 import sys
-from typing import Optional, Dict, Any
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Dict, Any, List
 from PySide6.QtWidgets import QApplication, QMainWindow, QDialog, QWidget
 from PySide6.QtUiTools import QUiLoader
-from PySide6.QtCore import QFile, QIODevice
+from PySide6.QtCore import QIODevice, QBuffer, QByteArray, QRunnable, QThreadPool
+
+logger = logging.getLogger(__name__)
+
+# Формат консольных сообщений при прямом запуске
+LOG_FORMAT = "%(message)s"
+
+# Пути к .ui файлам (вычисляются один раз при импорте)
+UI_DIR = os.path.dirname(os.path.abspath(__file__))
+MAIN_UI_PATH = os.path.join(UI_DIR, "thesolution_main.ui")
+DIALOG_UI_PATH = os.path.join(UI_DIR, "create_object_dialog.ui")
+
+# Максимальное число .ui файлов в кэше XML
+UI_CACHE_MAX_FILES = 16
+
+# Формы, заранее скомпилированные pyside6-uic (см. Scripts/compile_ui.py).
+# Без них или с THESOLUTION_USE_UI_LOADER=1 .ui файлы разбираются QUiLoader во время работы.
+USE_UI_LOADER = os.environ.get("THESOLUTION_USE_UI_LOADER") == "1"
+
+try:
+    from ui_thesolution_main import Ui_MainWindow
+except ImportError:
+    Ui_MainWindow = None
+
+try:
+    from ui_create_object_dialog import Ui_CreateObjectDialog
+except ImportError:
+    Ui_CreateObjectDialog = None
+
+# Значения по умолчанию для полей X, Y, Z, A, B, C
+COORDINATE_DEFAULTS = (0.0, 0.0, 0.0, 1.0, 1.0, 1.0)
+
+_shared_ui_loader: Optional[QUiLoader] = None
+
+def get_shared_ui_loader() -> QUiLoader:
+    """
+    Общий QUiLoader для всех окон и диалогов
+    
+    Создается при первом обращении (после QApplication). Использовать только
+    из GUI потока - QUiLoader создает виджеты.
+    """
+    global _shared_ui_loader
+    if _shared_ui_loader is None:
+        _shared_ui_loader = QUiLoader()
+    return _shared_ui_loader
 
 class UILoader:
     """Класс для загрузки UI файлов Qt Designer"""
     
+    # Общий LRU кэш XML содержимого .ui файлов (виджет нельзя разделить между
+    # родителями, поэтому кэшируется XML, а не виджет). Заполняется и из
+    # фонового потока (prewarm), поэтому доступ под блокировкой.
+    ui_xml_cache: "OrderedDict[str, QByteArray]" = OrderedDict()
+    _cache_lock = threading.Lock()
+    
     def __init__(self):
-        self.ui_loader = QUiLoader()
-        self.ui_files_cache: Dict[str, QWidget] = {}
+        self.ui_loader = get_shared_ui_loader()
+    
+    @classmethod
+    def read_ui_data(cls, ui_file_path: str) -> Optional[QByteArray]:
+        """
+        Возвращает XML содержимое .ui файла, читая файл только при первом обращении
+        
+        Безопасно вызывать из любого потока (виджеты не создаются).
+        """
+        with cls._cache_lock:
+            ui_data = cls.ui_xml_cache.get(ui_file_path)
+            if ui_data is not None:
+                cls.ui_xml_cache.move_to_end(ui_file_path)
+                return ui_data
+        
+        # Один open+read+close вместо отдельной проверки существования и QFile.open
+        try:
+            ui_data = QByteArray(Path(ui_file_path).read_bytes())
+        except OSError as e:
+            logger.error("Не удалось открыть UI файл %s: %s", ui_file_path, e)
+            return None
+        
+        with cls._cache_lock:
+            cls.ui_xml_cache[ui_file_path] = ui_data
+            if len(cls.ui_xml_cache) > UI_CACHE_MAX_FILES:
+                cls.ui_xml_cache.popitem(last=False)
+        return ui_data
+    
+    @classmethod
+    def prewarm(cls, ui_file_paths: List[str]):
+        """Читает .ui файлы в кэш в фоновом потоке, пока приложение стартует"""
+        QThreadPool.globalInstance().start(_UIPrewarmTask(ui_file_paths))
     
     def load_ui_file(self, ui_file_path: str, parent: Optional[QWidget] = None) -> Optional[QWidget]:
         """
@@ -31,34 +115,57 @@ class UILoader:
             Загруженный виджет или None в случае ошибки
         """
         try:
-            # Проверяем кэш
-            if ui_file_path in self.ui_files_cache:
-                return self.ui_files_cache[ui_file_path]
-            
-            # Открываем файл
-            ui_file = QFile(ui_file_path)
-            if not ui_file.open(QIODevice.ReadOnly):
-                print(f"❌ Не удалось открыть UI файл: {ui_file_path}")
+            ui_data = self.read_ui_data(ui_file_path)
+            if ui_data is None:
                 return None
             
-            # Загружаем UI
-            ui_widget = self.ui_loader.load(ui_file, parent)
-            ui_file.close()
+            # Загружаем UI из памяти (каждый вызов создает новый виджет)
+            buffer = QBuffer()
+            buffer.setData(ui_data)
+            buffer.open(QIODevice.ReadOnly)
+            ui_widget = self.ui_loader.load(buffer, parent)
+            buffer.close()
             
             if ui_widget is None:
-                print(f"❌ Не удалось загрузить UI файл: {ui_file_path}")
+                logger.error("Не удалось загрузить UI файл: %s", ui_file_path)
                 return None
             
-            # Кэшируем результат
-            self.ui_files_cache[ui_file_path] = ui_widget
-            
-            print(f"✅ UI файл загружен: {ui_file_path}")
+            logger.info("UI файл загружен: %s", ui_file_path)
             return ui_widget
             
         except Exception as e:
-            print(f"❌ Ошибка загрузки UI файла {ui_file_path}: {e}")
+            logger.error("Ошибка загрузки UI файла %s: %s", ui_file_path, e)
             return None
     
+    def invalidate(self, ui_file_path: Optional[str] = None):
+        """
+        Удаляет UI файл из кэша (например, после правки в Qt Designer)
+        
+        Args:
+            ui_file_path: Путь к .ui файлу; None - очистить весь кэш
+        """
+        with self._cache_lock:
+            if ui_file_path is None:
+                self.ui_xml_cache.clear()
+            else:
+                self.ui_xml_cache.pop(ui_file_path, None)
+    
+    def build_name_index(self, ui_widget: QWidget) -> Dict[str, QWidget]:
+        """
+        Строит индекс {имя: виджет} за один обход дерева виджетов
+        
+        Args:
+            ui_widget: Загруженный UI виджет
+            
+        Returns:
+            Словарь именованных дочерних виджетов
+        """
+        try:
+            return {w.objectName(): w for w in ui_widget.findChildren(QWidget) if w.objectName()}
+        except Exception as e:
+            logger.error("Ошибка индексации виджетов: %s", e)
+            return {}
+    
     def get_widget_by_name(self, ui_widget: QWidget, widget_name: str) -> Optional[QWidget]:
         """
         Находит виджет по имени в загруженном UI
@@ -69,13 +176,26 @@ class UILoader:
             
         Returns:
             Найденный виджет или None
+            
+        Для нескольких имен сразу используйте build_name_index.
         """
         try:
             return ui_widget.findChild(QWidget, widget_name)
         except Exception as e:
-            print(f"❌ Ошибка поиска виджета {widget_name}: {e}")
+            logger.error("Ошибка поиска виджета %s: %s", widget_name, e)
             return None
 
+class _UIPrewarmTask(QRunnable):
+    """Фоновое чтение .ui файлов в кэш UILoader"""
+    
+    def __init__(self, ui_file_paths: List[str]):
+        super().__init__()
+        self.ui_file_paths = list(ui_file_paths)
+    
+    def run(self):
+        for ui_file_path in self.ui_file_paths:
+            UILoader.read_ui_data(ui_file_path)
+
 class TheSolutionMainWindow(QMainWindow):
     """Главное окно приложения, загружаемое из UI файла"""
     
@@ -83,72 +203,100 @@ class TheSolutionMainWindow(QMainWindow):
         super().__init__()
         self.ui_loader = UILoader()
         self.ui_widget = None
-        self.load_main_ui()
+        # Виджеты формы появляются только в setup_ui_connections;
+        # до первого показа окна методы видят None и ничего не делают
+        self.solution_tree = None
+        self.create_box_button = None
+        self.create_sphere_button = None
+        self.create_cylinder_button = None
+        self.create_assembly_button = None
+        self.delete_object_button = None
+        self.x_spin_box = None
+        self.y_spin_box = None
+        self.z_spin_box = None
+        self.a_spin_box = None
+        self.b_spin_box = None
+        self.c_spin_box = None
+        self.apply_coordinates_button = None
+        self.reset_coordinates_button = None
+        self.info_text_edit = None
+        self._coord_widgets = ()
+        self._coords_ready = False
+        # UI загружается при первом показе окна (см. showEvent)
+        self._initialized = False
+    
+    def showEvent(self, event):
+        """Загружает UI при первом показе окна"""
+        if not self._initialized:
+            self._initialized = True
+            self.load_main_ui()
+        super().showEvent(event)
     
     def load_main_ui(self):
         """Загружает главное UI окно"""
-        ui_file_path = os.path.join(os.path.dirname(__file__), "thesolution_main.ui")
-        
-        if not os.path.exists(ui_file_path):
-            print(f"❌ UI файл не найден: {ui_file_path}")
+        if Ui_MainWindow is not None and not USE_UI_LOADER:
+            # Скомпилированная форма: виджеты создаются кодом, без разбора XML
+            self.ui = Ui_MainWindow()
+            self.ui.setupUi(self)
+            self.setup_ui_connections(vars(self.ui))
             return
         
-        self.ui_widget = self.ui_loader.load_ui_file(ui_file_path, self)
+        self.ui_widget = self.ui_loader.load_ui_file(MAIN_UI_PATH, self)
         if self.ui_widget:
-            self.setup_ui_connections()
+            # Один обход дерева виджетов вместо findChild на каждое имя
+            self.setup_ui_connections(self.ui_loader.build_name_index(self.ui_widget))
     
-    def setup_ui_connections(self):
-        """Настраивает соединения сигналов и слотов"""
-        if not self.ui_widget:
-            return
+    def setup_ui_connections(self, widgets: Dict[str, QWidget]):
+        """
+        Настраивает соединения сигналов и слотов
         
+        Args:
+            widgets: Словарь {имя: виджет} загруженной формы
+        """
         # Получаем основные виджеты
-        self.solution_tree = self.ui_loader.get_widget_by_name(self.ui_widget, "solutionTree")
-        self.create_box_button = self.ui_loader.get_widget_by_name(self.ui_widget, "createBoxButton")
-        self.create_sphere_button = self.ui_loader.get_widget_by_name(self.ui_widget, "createSphereButton")
-        self.create_cylinder_button = self.ui_loader.get_widget_by_name(self.ui_widget, "createCylinderButton")
-        self.create_assembly_button = self.ui_loader.get_widget_by_name(self.ui_widget, "createAssemblyButton")
-        self.delete_object_button = self.ui_loader.get_widget_by_name(self.ui_widget, "deleteObjectButton")
+        self.solution_tree = widgets.get("solutionTree")
+        self.create_box_button = widgets.get("createBoxButton")
+        self.create_sphere_button = widgets.get("createSphereButton")
+        self.create_cylinder_button = widgets.get("createCylinderButton")
+        self.create_assembly_button = widgets.get("createAssemblyButton")
+        self.delete_object_button = widgets.get("deleteObjectButton")
         
         # Получаем элементы координат
-        self.x_spin_box = self.ui_loader.get_widget_by_name(self.ui_widget, "xSpinBox")
-        self.y_spin_box = self.ui_loader.get_widget_by_name(self.ui_widget, "ySpinBox")
-        self.z_spin_box = self.ui_loader.get_widget_by_name(self.ui_widget, "zSpinBox")
-        self.a_spin_box = self.ui_loader.get_widget_by_name(self.ui_widget, "aSpinBox")
-        self.b_spin_box = self.ui_loader.get_widget_by_name(self.ui_widget, "bSpinBox")
-        self.c_spin_box = self.ui_loader.get_widget_by_name(self.ui_widget, "cSpinBox")
+        self.x_spin_box = widgets.get("xSpinBox")
+        self.y_spin_box = widgets.get("ySpinBox")
+        self.z_spin_box = widgets.get("zSpinBox")
+        self.a_spin_box = widgets.get("aSpinBox")
+        self.b_spin_box = widgets.get("bSpinBox")
+        self.c_spin_box = widgets.get("cSpinBox")
+        # Проверка наличия всех полей координат делается один раз, а не на каждый клик
+        self._coord_widgets = (self.x_spin_box, self.y_spin_box, self.z_spin_box,
+                               self.a_spin_box, self.b_spin_box, self.c_spin_box)
+        self._coords_ready = all(self._coord_widgets)
         
-        self.apply_coordinates_button = self.ui_loader.get_widget_by_name(self.ui_widget, "applyCoordinatesButton")
-        self.reset_coordinates_button = self.ui_loader.get_widget_by_name(self.ui_widget, "resetCoordinatesButton")
+        self.apply_coordinates_button = widgets.get("applyCoordinatesButton")
+        self.reset_coordinates_button = widgets.get("resetCoordinatesButton")
         
         # Получаем информационную панель
-        self.info_text_edit = self.ui_loader.get_widget_by_name(self.ui_widget, "infoTextEdit")
-        
-        # Подключаем сигналы
-        if self.create_box_button:
-            self.create_box_button.clicked.connect(self.create_box)
-        
-        if self.create_sphere_button:
-            self.create_sphere_button.clicked.connect(self.create_sphere)
-        
-        if self.create_cylinder_button:
-            self.create_cylinder_button.clicked.connect(self.create_cylinder)
-        
-        if self.create_assembly_button:
-            self.create_assembly_button.clicked.connect(self.create_assembly)
-        
-        if self.delete_object_button:
-            self.delete_object_button.clicked.connect(self.delete_object)
+        self.info_text_edit = widgets.get("infoTextEdit")
         
-        if self.apply_coordinates_button:
-            self.apply_coordinates_button.clicked.connect(self.apply_coordinates)
+        # Подключаем сигналы: (виджет, сигнал, слот)
+        # Слот - всегда bound-метод; строковые SIGNAL()/SLOT() не используем,
+        # они требуют разбора и нормализации сигнатуры при каждом connect
+        bindings = (
+            (self.create_box_button, "clicked", self.create_box),
+            (self.create_sphere_button, "clicked", self.create_sphere),
+            (self.create_cylinder_button, "clicked", self.create_cylinder),
+            (self.create_assembly_button, "clicked", self.create_assembly),
+            (self.delete_object_button, "clicked", self.delete_object),
+            (self.apply_coordinates_button, "clicked", self.apply_coordinates),
+            (self.reset_coordinates_button, "clicked", self.reset_coordinates),
+            # Выбор в дереве
+            (self.solution_tree, "itemSelectionChanged", self.on_tree_selection_changed),
+        )
         
-        if self.reset_coordinates_button:
-            self.reset_coordinates_button.clicked.connect(self.reset_coordinates)
-        
-        # Подключаем выбор в дереве
-        if self.solution_tree:
-            self.solution_tree.itemSelectionChanged.connect(self.on_tree_selection_changed)
+        for widget, signal_name, slot in bindings:
+            if widget:
+                getattr(widget, signal_name).connect(slot)
     
     def create_box(self):
         """Создает куб"""
@@ -177,29 +325,20 @@ class TheSolutionMainWindow(QMainWindow):
     
     def apply_coordinates(self):
         """Применяет изменения координат"""
-        if all([self.x_spin_box, self.y_spin_box, self.z_spin_box, 
-                self.a_spin_box, self.b_spin_box, self.c_spin_box]):
-            x = self.x_spin_box.value()
-            y = self.y_spin_box.value()
-            z = self.z_spin_box.value()
-            a = self.a_spin_box.value()
-            b = self.b_spin_box.value()
-            c = self.c_spin_box.value()
-            
-            self.log_info(f"Координаты применены: X={x}, Y={y}, Z={z}, A={a}, B={b}, C={c}")
+        if not self._coords_ready:
+            return
+        
+        x, y, z, a, b, c = (w.value() for w in self._coord_widgets)
+        self.log_info(f"Координаты применены: X={x}, Y={y}, Z={z}, A={a}, B={b}, C={c}")
     
     def reset_coordinates(self):
         """Сбрасывает координаты"""
-        if all([self.x_spin_box, self.y_spin_box, self.z_spin_box, 
-                self.a_spin_box, self.b_spin_box, self.c_spin_box]):
-            self.x_spin_box.setValue(0.0)
-            self.y_spin_box.setValue(0.0)
-            self.z_spin_box.setValue(0.0)
-            self.a_spin_box.setValue(1.0)
-            self.b_spin_box.setValue(1.0)
-            self.c_spin_box.setValue(1.0)
-            
-            self.log_info("Координаты сброшены")
+        if not self._coords_ready:
+            return
+        
+        for widget, value in zip(self._coord_widgets, COORDINATE_DEFAULTS):
+            widget.setValue(value)
+        self.log_info("Координаты сброшены")
     
     def on_tree_selection_changed(self):
         """Обработчик изменения выбора в дереве"""
@@ -221,30 +360,43 @@ class CreateObjectDialog(QDialog):
         super().__init__(parent)
         self.ui_loader = UILoader()
         self.ui_widget = None
-        self.load_dialog_ui()
+        self.object_type_combo = None
+        self.object_name_edit = None
+        # UI загружается при первом показе диалога (см. showEvent)
+        self._initialized = False
+    
+    def showEvent(self, event):
+        """Загружает UI при первом показе диалога"""
+        if not self._initialized:
+            self._initialized = True
+            self.load_dialog_ui()
+        super().showEvent(event)
     
     def load_dialog_ui(self):
         """Загружает UI диалога"""
-        ui_file_path = os.path.join(os.path.dirname(__file__), "create_object_dialog.ui")
-        
-        if not os.path.exists(ui_file_path):
-            print(f"❌ UI файл диалога не найден: {ui_file_path}")
+        if Ui_CreateObjectDialog is not None and not USE_UI_LOADER:
+            # Скомпилированная форма: виджеты создаются кодом, без разбора XML
+            self.ui = Ui_CreateObjectDialog()
+            self.ui.setupUi(self)
+            self.setup_dialog_connections(vars(self.ui))
             return
         
-        self.ui_widget = self.ui_loader.load_ui_file(ui_file_path, self)
+        self.ui_widget = self.ui_loader.load_ui_file(DIALOG_UI_PATH, self)
         if self.ui_widget:
-            self.setup_dialog_connections()
+            self.setup_dialog_connections(self.ui_loader.build_name_index(self.ui_widget))
     
-    def setup_dialog_connections(self):
-        """Настраивает соединения диалога"""
-        if not self.ui_widget:
-            return
+    def setup_dialog_connections(self, widgets: Dict[str, QWidget]):
+        """
+        Настраивает соединения диалога
         
+        Args:
+            widgets: Словарь {имя: виджет} загруженной формы
+        """
         # Получаем виджеты диалога
-        self.object_type_combo = self.ui_loader.get_widget_by_name(self.ui_widget, "objectTypeComboBox")
-        self.object_name_edit = self.ui_loader.get_widget_by_name(self.ui_widget, "objectNameEdit")
-        self.create_button = self.ui_loader.get_widget_by_name(self.ui_widget, "createButton")
-        self.cancel_button = self.ui_loader.get_widget_by_name(self.ui_widget, "cancelButton")
+        self.object_type_combo = widgets.get("objectTypeComboBox")
+        self.object_name_edit = widgets.get("objectNameEdit")
+        self.create_button = widgets.get("createButton")
+        self.cancel_button = widgets.get("cancelButton")
         
         # Подключаем сигналы
         if self.create_button:
@@ -259,7 +411,7 @@ class CreateObjectDialog(QDialog):
     
     def on_object_type_changed(self, object_type: str):
         """Обработчик изменения типа объекта"""
-        print(f"Выбран тип объекта: {object_type}")
+        logger.info("Выбран тип объекта: %s", object_type)
         # Здесь можно добавить логику показа/скрытия соответствующих параметров
     
     def get_object_data(self) -> Dict[str, Any]:
@@ -272,12 +424,15 @@ class CreateObjectDialog(QDialog):
 
 def test_ui_loader():
     """Тестирует загрузчик UI файлов"""
+    # Сообщения загрузчика (logger.info) видны в консоли
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
     print("🧪 Тестирование UI загрузчика...")
     
     # Создаем приложение
     app = QApplication.instance()
     if app is None:
         app = QApplication(sys.argv)
+    UILoader.prewarm([MAIN_UI_PATH, DIALOG_UI_PATH])
     
     # Тестируем загрузку главного окна
     main_window = TheSolutionMainWindow()
@@ -288,5 +443,27 @@ def test_ui_loader():
     
     return app.exec()
 
+def main():
+    """Точка входа приложения"""
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+    
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    
+    # .ui файлы читаются в фоне, пока строится окно; скомпилированным формам XML не нужен
+    ui_paths = []
+    if Ui_MainWindow is None or USE_UI_LOADER:
+        ui_paths.append(MAIN_UI_PATH)
+    if Ui_CreateObjectDialog is None or USE_UI_LOADER:
+        ui_paths.append(DIALOG_UI_PATH)
+    if ui_paths:
+        UILoader.prewarm(ui_paths)
+    
+    main_window = TheSolutionMainWindow()
+    main_window.show()
+    
+    return app.exec()
+
 if __name__ == "__main__":
-    test_ui_loader()
+    sys.exit(main())
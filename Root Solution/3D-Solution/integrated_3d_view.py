@@ -6,6 +6,7 @@ Full integration with UI file and bidirectional communication
 
 import sys
 import os
+from contextlib import contextmanager
 from typing import Dict, Any, Optional, List
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, 
@@ -113,6 +114,7 @@ class Integrated3DViewManager(QObject):
         self.object_positions = {}  # Store object positions
         self.object_rotations = {}  # Store object rotations
         self.object_scales = {}  # Store object scales
+        self._batch_depth = 0  # Nesting level of batch_updates()
         
         # UI references (will be set by main window)
         self.view_toolbar = None
@@ -125,6 +127,20 @@ class Integrated3DViewManager(QObject):
             self.visualization = Visualization3D()
             print("✅ Visualization3D initialized for integrated 3D view")
     
+    @contextmanager
+    def batch_updates(self):
+        """Defer viewer redraws until the outermost block exits (reentrant)
+        
+        Inside the block add_shape does not FitAll; call fit_all() after it.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self.context:
+                self.context.UpdateCurrentViewer()
+    
     def setup_ui_references(self, view_toolbar, view_status_bar, solution_tree, open_gl_widget):
         """Setup references to UI elements"""
         self.view_toolbar = view_toolbar
@@ -423,11 +439,12 @@ class Integrated3DViewManager(QObject):
                 self.object_rotations[object_id] = rotation
                 self.object_scales[object_id] = scale
                 
-                # Display in context
-                self.context.Display(ais_shape, True)
-                
-                # Update view
-                self.display.View.FitAll()
+                # Display in context (redraw and fit are left to the caller inside batch_updates)
+                if self._batch_depth == 0:
+                    self.context.Display(ais_shape, True)
+                    self.display.View.FitAll()
+                else:
+                    self.context.Display(ais_shape, False)
                 
                 self.update_status(f"✅ Added object: {object_id}")
                 return True
@@ -533,7 +550,7 @@ class Integrated3DViewManager(QObject):
         
         try:
             ais_shape = self.ais_shapes[object_id]
-            self.context.Erase(ais_shape, True)
+            self.context.Erase(ais_shape, self._batch_depth == 0)
             del self.ais_shapes[object_id]
             
             # Clean up stored data
@@ -665,7 +682,7 @@ class Integrated3DViewManager(QObject):
                 ais_shape.SetTransparency(transparency)
             
             # Redisplay the shape to apply changes
-            self.context.Redisplay(ais_shape, True)
+            self.context.Redisplay(ais_shape, self._batch_depth == 0)
             
             self.update_status(f"✅ Updated visualization for: {object_id}")
             return True
@@ -6,8 +6,11 @@
 
 import sys
 import os
+import json
+import math
 import time
 import threading
+from functools import lru_cache
 from datetime import datetime
 from typing import Dict, Any, Optional
 
@@ -29,14 +32,14 @@ try:
     from PySide6.QtWidgets import (
         QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
         QWidget, QTreeWidget, QTreeWidgetItem, QPushButton, 
-        QTextEdit, QLabel, QSpinBox, QComboBox, QGroupBox,
+        QPlainTextEdit, QLabel, QSpinBox, QComboBox, QGroupBox,
         QGridLayout, QMessageBox, QProgressBar, QSplitter
     )
-    from PySide6.QtCore import Qt, QThread, Signal, QTimer
+    from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, Signal, QTimer
     from PySide6.QtGui import QFont, QColor, QPalette, QLinearGradient, QBrush
     
     # Import data types system
-    from solution_data_types import SolutionType, SolutionDataUtils, SolutionCoordinate
+    from solution_data_types import SolutionType
     
     # Import OpenCASCADE integration
     try:
@@ -69,85 +72,207 @@ except ImportError as e:
     print(f"ERROR: Import failed - {e}")
     sys.exit(1)
 
-class ObjectCreationThread(QThread):
-    """Thread for creating objects with OpenCASCADE"""
+# Maximum number of lines kept in the log panel
+LOG_MAX_BLOCKS = 1000
+
+# Export file format: "json" (default) or "txt" (legacy text layout)
+EXPORT_FORMAT = "json"
+# Runtime-only object fields that are not written to export files
+NON_EXPORTED_FIELDS = ('occ_shape', 'shape')
+
+def _export_json_default(value):
+    """json.dumps fallback for values in object data"""
+    if isinstance(value, SolutionType):
+        return value.value
+    return str(value)
+
+# Per-object record written by TheSolution3DWindow.export_objects (txt format)
+EXPORT_RECORD_TEMPLATE = (
+    "Object ID: {id}\n"
+    "Name: {name}\n"
+    "Type: {type}\n"
+    "Position: ({x}, {y}, {z})\n"
+    "{volume_line}"
+    "Created: {created_at}\n"
+    + "-" * 20 + "\n\n"
+)
+
+# Application stylesheet, applied once in main() and shared by all windows
+MAIN_WINDOW_STYLESHEET = """
+    QMainWindow {
+        background-color: #2c3e50;
+        color: white;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #34495e;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+    }
+    QPushButton {
+        background-color: #3498db;
+        border: none;
+        color: white;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #2980b9;
+    }
+    QPushButton:pressed {
+        background-color: #21618c;
+    }
+    QTreeWidget {
+        background-color: #34495e;
+        border: 1px solid #2c3e50;
+        border-radius: 4px;
+    }
+    QTreeWidget::item {
+        padding: 4px;
+    }
+    QTreeWidget::item:selected {
+        background-color: #3498db;
+    }
+    QTextEdit, QPlainTextEdit {
+        background-color: #34495e;
+        border: 1px solid #2c3e50;
+        border-radius: 4px;
+        color: white;
+        font-family: 'Courier New';
+    }
+    QSpinBox {
+        background-color: #34495e;
+        border: 1px solid #2c3e50;
+        border-radius: 4px;
+        color: white;
+        padding: 4px;
+    }
+"""
+
+# Shared OpenCASCADE integration (kernel init is expensive, do it once)
+_occ_integration = None
+_occ_integration_lock = threading.Lock()
+# Serializes OCC modelling calls made from pool threads
+_occ_lock = threading.Lock()
+
+def get_occ_integration():
+    """Return the shared OpenCascadeIntegration, creating it on first use"""
+    global _occ_integration
+    if _occ_integration is None:
+        with _occ_integration_lock:
+            if _occ_integration is None:
+                _occ_integration = OpenCascadeIntegration()
+    return _occ_integration
+
+FOUR_THIRDS_PI = (4.0 / 3.0) * math.pi
+
+# Volume formulas by type: (width, height, depth, radius) -> volume
+VOLUME_FORMULAS = {
+    SolutionType.BOX: lambda w, h, d, r: w * h * d,
+    SolutionType.SPHERE: lambda w, h, d, r: FOUR_THIRDS_PI * r * r * r,
+    SolutionType.CYLINDER: lambda w, h, d, r: math.pi * r * r * h,
+}
+
+# Object tree background by type
+TYPE_BRUSHES = {
+    SolutionType.BOX: QBrush(QColor(52, 152, 219)),       # Blue
+    SolutionType.SPHERE: QBrush(QColor(46, 204, 113)),    # Green
+    SolutionType.CYLINDER: QBrush(QColor(155, 89, 182)),  # Purple
+}
+
+# Dimensions that define each primitive's geometry
+TYPE_DIMENSIONS = {
+    SolutionType.BOX: ('width', 'height', 'depth'),
+    SolutionType.SPHERE: ('radius',),
+    SolutionType.CYLINDER: ('radius', 'height'),
+}
+
+@lru_cache(maxsize=512)
+def occ_base_shape(obj_type: SolutionType, dimensions: tuple):
+    """
+    OCC shape at the origin and its volume, cached by type and dimensions
+    
+    dimensions is a tuple of (name, value) pairs. Returns (shape, volume);
+    raises RuntimeError if the shape could not be created, so the failure
+    is not cached and the next request retries.
+    """
+    integration = get_occ_integration()
+    with _occ_lock:
+        shape = integration.create_occ_shape(obj_type, dict(dimensions))
+        if shape is None:
+            raise RuntimeError("OpenCASCADE integration failed")
+        return shape, integration.calculate_volume(shape)
+
+@lru_cache(maxsize=1024)
+def shape_volume(obj_type: SolutionType, width: float, height: float,
+                 depth: float, radius: float) -> float:
+    """Объем примитива по типу и размерам (кэшируется для повторных параметров)"""
+    formula = VOLUME_FORMULAS.get(obj_type)
+    return formula(width, height, depth, radius) if formula else 0.0
+
+class ObjectCreationSignals(QObject):
+    """Signals emitted by ObjectCreationRunnable (QRunnable is not a QObject)"""
     object_created = Signal(dict)
     creation_failed = Signal(str)
+
+class ObjectCreationRunnable(QRunnable):
+    """Pool task for creating objects with OpenCASCADE"""
     
     def __init__(self, object_data: Dict[str, Any]):
         super().__init__()
         self.object_data = object_data
+        self.signals = ObjectCreationSignals()
+        self.setAutoDelete(True)
     
     def run(self):
-        """Create object in separate thread"""
+        """Create object on a pool thread"""
         try:
-            # Simulate object creation
-            time.sleep(0.5)  # Simulate work
-            
             # If OpenCASCADE is available, use it
             if OCC_AVAILABLE:
                 try:
-                    integration = OpenCascadeIntegration()
+                    integration = get_occ_integration()
                     if integration.occ_available:
-                        # Create SolutionData
-                        solution_data = SolutionDataUtils.create_minimal_solution_data(
-                            name=self.object_data['name'],
-                            solution_type=self.object_data['type'],
-                            coordinate=SolutionCoordinate(
-                                self.object_data['x'], 
-                                self.object_data['y'], 
-                                self.object_data['z']
-                            )
-                        )
-                        
-                        # Set dimensions
-                        if self.object_data['type'] == SolutionType.BOX:
-                            solution_data.dimensions.width = self.object_data['width']
-                            solution_data.dimensions.height = self.object_data['height']
-                            solution_data.dimensions.depth = self.object_data['depth']
-                        elif self.object_data['type'] == SolutionType.SPHERE:
-                            solution_data.dimensions.radius = self.object_data['radius']
-                        elif self.object_data['type'] == SolutionType.CYLINDER:
-                            solution_data.dimensions.radius = self.object_data['radius']
-                            solution_data.dimensions.height = self.object_data['height']
+                        data = self.object_data
+                        obj_type = data['type']
+                        dimensions = tuple((name, data[name]) for name in TYPE_DIMENSIONS.get(obj_type, ()))
                         
-                        # Integration with OpenCASCADE
-                        result = integration.integrate_with_solution_data(solution_data)
+                        # Geometry is cached by (type, dimensions); only the placement is per object
+                        try:
+                            shape, volume = occ_base_shape(obj_type, dimensions)
+                        except RuntimeError as e:
+                            self.signals.creation_failed.emit(str(e))
+                            return
                         
-                        if result:
-                            self.object_data['volume'] = result['volume']
-                            self.object_data['occ_shape'] = result['occ_shape']
-                            self.object_data['occ_available'] = True
-                            self.object_created.emit(self.object_data)
-                        else:
-                            self.creation_failed.emit("OpenCASCADE integration failed")
+                        with _occ_lock:
+                            occ_shape = integration.transform_shape(shape, (data['x'], data['y'], data['z']))
+                        data['volume'] = volume
+                        data['occ_shape'] = occ_shape
+                        data['occ_available'] = True
+                        self.signals.object_created.emit(data)
                     else:
-                        self.creation_failed.emit("OpenCASCADE not available")
+                        self.signals.creation_failed.emit("OpenCASCADE not available")
                 except Exception as e:
-                    self.creation_failed.emit(f"OpenCASCADE error: {e}")
+                    self.signals.creation_failed.emit(f"OpenCASCADE error: {e}")
             else:
                 # Fallback без OpenCASCADE
                 self.object_data['volume'] = self._calculate_volume_fallback()
                 self.object_data['occ_available'] = False
-                self.object_created.emit(self.object_data)
+                self.signals.object_created.emit(self.object_data)
             
         except Exception as e:
-            self.creation_failed.emit(f"Object creation failed: {e}")
+            self.signals.creation_failed.emit(f"Object creation failed: {e}")
     
     def _calculate_volume_fallback(self) -> float:
         """Расчет объема без OpenCASCADE"""
-        obj_type = self.object_data['type']
-        
-        if obj_type == SolutionType.BOX:
-            return self.object_data['width'] * self.object_data['height'] * self.object_data['depth']
-        elif obj_type == SolutionType.SPHERE:
-            import math
-            return (4/3) * math.pi * (self.object_data['radius'] ** 3)
-        elif obj_type == SolutionType.CYLINDER:
-            import math
-            return math.pi * (self.object_data['radius'] ** 2) * self.object_data['height']
-        else:
-            return 0.0
+        data = self.object_data
+        return shape_volume(data['type'], data['width'], data['height'], data['depth'], data['radius'])
 
 class TheSolution3DWindow(QMainWindow):
     """Main window 3D-Solution with OpenCASCADE integration"""
@@ -156,7 +281,22 @@ class TheSolution3DWindow(QMainWindow):
         super().__init__()
         self.objects = {}  # Objects dictionary
         self.object_counter = 0
-        self.creation_threads = []  # List of active threads
+        
+        # Timestamp cache (re-formatted only when the second changes)
+        self._last_ts_sec = -1
+        self._last_ts_str = ""
+        self._last_iso = ""
+        
+        # Shared pool for object creation tasks
+        self.creation_pool = QThreadPool.globalInstance()
+        self.creation_pool.setMaxThreadCount(os.cpu_count() or 2)
+        
+        # Created objects are added to the tree in batches
+        self._pending_tree_items = []
+        self._pending_3d_objects = []  # Shown in the 3D view in the same batched flush
+        self._tree_flush_timer = QTimer(self)
+        self._tree_flush_timer.setSingleShot(True)
+        self._tree_flush_timer.timeout.connect(self._flush_tree_items)
         
         # Initialize visualization settings
         self.visualization_settings = {}
@@ -182,7 +322,6 @@ class TheSolution3DWindow(QMainWindow):
             }
         
         self.init_ui_from_file()
-        self.setup_styles()
         
         # Check OpenCASCADE availability
         self.check_opencascade()
@@ -551,9 +690,10 @@ class TheSolution3DWindow(QMainWindow):
         log_group = QGroupBox("Event Log")
         log_layout = QVBoxLayout(log_group)
         
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setMaximumHeight(200)
+        self.log_text.document().setMaximumBlockCount(LOG_MAX_BLOCKS)
         log_layout.addWidget(self.log_text)
         
         right_layout.addWidget(log_group)
@@ -565,71 +705,11 @@ class TheSolution3DWindow(QMainWindow):
         
         parent.addWidget(right_widget)
     
-    def setup_styles(self):
-        """Setup styles"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #2c3e50;
-                color: white;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #34495e;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-            QPushButton {
-                background-color: #3498db;
-                border: none;
-                color: white;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:pressed {
-                background-color: #21618c;
-            }
-            QTreeWidget {
-                background-color: #34495e;
-                border: 1px solid #2c3e50;
-                border-radius: 4px;
-            }
-            QTreeWidget::item {
-                padding: 4px;
-            }
-            QTreeWidget::item:selected {
-                background-color: #3498db;
-            }
-            QTextEdit {
-                background-color: #34495e;
-                border: 1px solid #2c3e50;
-                border-radius: 4px;
-                color: white;
-                font-family: 'Courier New';
-            }
-            QSpinBox {
-                background-color: #34495e;
-                border: 1px solid #2c3e50;
-                border-radius: 4px;
-                color: white;
-                padding: 4px;
-            }
-        """)
-    
     def check_opencascade(self):
         """Check OpenCASCADE availability"""
         if OCC_AVAILABLE:
             try:
-                integration = OpenCascadeIntegration()
+                integration = get_occ_integration()
                 if integration.occ_available:
                     self.occ_status_label.setText("OpenCASCADE: ✅ Available")
                     self.occ_status_label.setStyleSheet("color: #27ae60; font-weight: bold;")
@@ -697,13 +777,11 @@ class TheSolution3DWindow(QMainWindow):
         self.object_counter += 1
         
         # Get parameters from UI
-        x = self.x_spinbox.value()
-        y = self.y_spinbox.value()
-        z = self.z_spinbox.value()
-        width = self.width_spinbox.value()
-        height = self.height_spinbox.value()
-        depth = self.depth_spinbox.value()
-        radius = self.radius_spinbox.value()
+        x, y, z, width, height, depth, radius = (spinbox.value() for spinbox in (
+            self.x_spinbox, self.y_spinbox, self.z_spinbox,
+            self.width_spinbox, self.height_spinbox, self.depth_spinbox,
+            self.radius_spinbox
+        ))
         
         # Create object data
         object_data = {
@@ -713,16 +791,15 @@ class TheSolution3DWindow(QMainWindow):
             'x': x, 'y': y, 'z': z,
             'width': width, 'height': height, 'depth': depth,
             'radius': radius,
-            'created_at': datetime.now().isoformat()
+            'created_at': self._current_timestamps()[1]
         }
         
-        # Create thread for object creation
-        thread = ObjectCreationThread(object_data)
-        thread.object_created.connect(self.on_object_created)
-        thread.creation_failed.connect(self.on_creation_failed)
+        # Submit object creation to the pool
+        task = ObjectCreationRunnable(object_data)
+        task.signals.object_created.connect(self.on_object_created)
+        task.signals.creation_failed.connect(self.on_creation_failed)
         
-        self.creation_threads.append(thread)
-        thread.start()
+        self.creation_pool.start(task)
         
         # Show progress
         self.progress_bar.setVisible(True)
@@ -734,11 +811,12 @@ class TheSolution3DWindow(QMainWindow):
         """Handle successful object creation"""
         # Add to objects dictionary
         self.objects[object_data['id']] = object_data
+        obj_type = object_data['type']
         
         # Add to tree
         item = QTreeWidgetItem()
         item.setText(0, object_data['name'])
-        item.setText(1, object_data['type'].value)
+        item.setText(1, obj_type.value)
         item.setText(2, str(object_data['id']))
         
         if 'volume' in object_data:
@@ -746,18 +824,17 @@ class TheSolution3DWindow(QMainWindow):
             item.setText(3, volume_text)
             
             # Color coding by type
-            if object_data['type'] == SolutionType.BOX:
-                item.setBackground(0, QColor(52, 152, 219))  # Blue
-            elif object_data['type'] == SolutionType.SPHERE:
-                item.setBackground(0, QColor(46, 204, 113))  # Green
-            elif object_data['type'] == SolutionType.CYLINDER:
-                item.setBackground(0, QColor(155, 89, 182))  # Purple
+            brush = TYPE_BRUSHES.get(obj_type)
+            if brush is not None:
+                item.setBackground(0, brush)
         
-        self.object_tree.addTopLevelItem(item)
+        self._pending_tree_items.append(item)
+        if not self._tree_flush_timer.isActive():
+            self._tree_flush_timer.start(0)
         
-        # Add to 3D view if available
-        if OCC_3D_VIEW_AVAILABLE and hasattr(self, 'occ_3d_view_manager') and 'shape' in object_data:
-            self.add_object_to_3d_view(object_data)
+        # Add to 3D view if available (batched with the tree flush)
+        if OCC_3D_VIEW_AVAILABLE and hasattr(self, 'occ_3d_view_manager') and object_data.get('occ_shape') is not None:
+            self._pending_3d_objects.append(object_data)
         
         # Hide progress
         self.progress_bar.setVisible(False)
@@ -767,6 +844,27 @@ class TheSolution3DWindow(QMainWindow):
         volume_info = f" (Volume: {object_data.get('volume', 0):.2f})" if 'volume' in object_data else ""
         self.log_message(f"✅ Created {object_data['name']} {occ_status}{volume_info}")
     
+    def _flush_tree_items(self):
+        """Insert queued tree items (and 3D shapes) in one batch"""
+        if self._pending_3d_objects:
+            pending, self._pending_3d_objects = self._pending_3d_objects, []
+            # One viewer redraw for all objects created since the last flush
+            with self.occ_3d_view_manager.batch_updates():
+                for object_data in pending:
+                    self.add_object_to_3d_view(object_data)
+            # Fit once after the bulk load instead of per shape
+            self.occ_3d_view_manager.fit_all()
+        
+        if not self._pending_tree_items:
+            return
+        
+        items, self._pending_tree_items = self._pending_tree_items, []
+        self.object_tree.setUpdatesEnabled(False)
+        try:
+            self.object_tree.addTopLevelItems(items)
+        finally:
+            self.object_tree.setUpdatesEnabled(True)
+    
     def add_object_to_3d_view(self, object_data: Dict[str, Any]):
         """Add object to 3D view"""
         if not OCC_3D_VIEW_AVAILABLE or not hasattr(self, 'occ_3d_view_manager'):
@@ -774,7 +872,7 @@ class TheSolution3DWindow(QMainWindow):
         
         try:
             # Get shape from object data
-            shape = object_data.get('shape')
+            shape = object_data.get('occ_shape')
             if shape is None:
                 self.log_message(f"❌ No shape data for object {object_data['id']}")
                 return
@@ -830,16 +928,18 @@ class TheSolution3DWindow(QMainWindow):
             return
         
         try:
-            # Update all objects in 3D view
-            for object_id in self.occ_3d_view_manager.ais_shapes.keys():
-                self.occ_3d_view_manager.update_shape_visualization(
-                    object_id=object_id,
-                    color=settings.get('color'),
-                    material_type=settings.get('material_type'),
-                    line_style=settings.get('line_style'),
-                    gradient_type=settings.get('gradient_type'),
-                    transparency=settings.get('transparency')
-                )
+            # Update all objects in 3D view with a single redraw
+            view = self.occ_3d_view_manager
+            with view.batch_updates():
+                for object_id in view.ais_shapes.keys():
+                    view.update_shape_visualization(
+                        object_id=object_id,
+                        color=settings.get('color'),
+                        material_type=settings.get('material_type'),
+                        line_style=settings.get('line_style'),
+                        gradient_type=settings.get('gradient_type'),
+                        transparency=settings.get('transparency')
+                    )
             
             self.log_message("✅ Updated 3D view visualization settings")
             
@@ -882,25 +982,33 @@ class TheSolution3DWindow(QMainWindow):
             QMessageBox.information(self, "No Objects", "No objects to export")
             return
         
-        # Simple export to text file
-        filename = f"thesolution_objects_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+        filename = f"thesolution_objects_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{EXPORT_FORMAT}"
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write("TheSolution CAD - Exported Objects\n")
-                f.write("=" * 40 + "\n\n")
-                
+            # Build the whole document first and write it in one call
+            if EXPORT_FORMAT == "json":
+                records = [
+                    {key: value for key, value in obj_data.items() if key not in NON_EXPORTED_FIELDS}
+                    for obj_data in self.objects.values()
+                ]
+                content = json.dumps({'objects': records}, ensure_ascii=False, indent=2,
+                                     default=_export_json_default)
+            else:
+                parts = ["TheSolution CAD - Exported Objects\n", "=" * 40 + "\n\n"]
                 for obj_id, obj_data in self.objects.items():
-                    f.write(f"Object ID: {obj_id}\n")
-                    f.write(f"Name: {obj_data['name']}\n")
-                    f.write(f"Type: {obj_data['type'].value}\n")
-                    f.write(f"Position: ({obj_data['x']}, {obj_data['y']}, {obj_data['z']})\n")
-                    
-                    if 'volume' in obj_data:
-                        f.write(f"Volume: {obj_data['volume']:.2f}\n")
-                    
-                    f.write(f"Created: {obj_data['created_at']}\n")
-                    f.write("-" * 20 + "\n\n")
+                    volume_line = f"Volume: {obj_data['volume']:.2f}\n" if 'volume' in obj_data else ""
+                    parts.append(EXPORT_RECORD_TEMPLATE.format(
+                        id=obj_id,
+                        name=obj_data['name'],
+                        type=obj_data['type'].value,
+                        x=obj_data['x'], y=obj_data['y'], z=obj_data['z'],
+                        volume_line=volume_line,
+                        created_at=obj_data['created_at']
+                    ))
+                content = "".join(parts)
+            
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.write(content)
             
             self.log_message(f"📁 Exported {len(self.objects)} objects to {filename}")
             QMessageBox.information(self, "Export Success", f"Objects exported to {filename}")
@@ -914,12 +1022,21 @@ class TheSolution3DWindow(QMainWindow):
         QMessageBox.information(self, "Import", "Import functionality coming soon...")
         self.log_message("📥 Import functionality not implemented yet")
     
+    def _current_timestamps(self):
+        """Return cached (HH:MM:SS, ISO) strings for the current second"""
+        now_sec = int(time.time())
+        if now_sec != self._last_ts_sec:
+            self._last_ts_sec = now_sec
+            local = time.localtime(now_sec)
+            self._last_ts_str = time.strftime("%H:%M:%S", local)
+            self._last_iso = time.strftime("%Y-%m-%dT%H:%M:%S", local)
+        return self._last_ts_str, self._last_iso
+    
     def log_message(self, message: str):
         """Add message to log"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}"
+        log_entry = f"[{self._current_timestamps()[0]}] {message}"
         
-        self.log_text.append(log_entry)
+        self.log_text.appendPlainText(log_entry)
         
         # Auto-scroll to end
         scrollbar = self.log_text.verticalScrollBar()
@@ -928,6 +1045,7 @@ class TheSolution3DWindow(QMainWindow):
 def main():
     """Main function"""
     app = QApplication(sys.argv)
+    app.setStyleSheet(MAIN_WINDOW_STYLESHEET)
     
     # Create and show main window
     window = TheSolution3DWindow()
@@ -6,7 +6,10 @@
 
 import sys
 import os
+import logging
+from collections import defaultdict
 from pathlib import Path
+from typing import List
 
 # Добавляем пути к базовым модулям
 project_root = Path(__file__).parent.parent.parent
@@ -14,8 +17,8 @@ sys.path.insert(0, str(project_root / "Base Solution" / "python"))
 sys.path.insert(0, str(project_root))
 
 try:
-    from PySide6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, QPushButton, QLabel, QTreeWidget, QTreeWidgetItem
-    from PySide6.QtCore import Qt
+    from PySide6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, QPushButton, QLabel, QTreeWidget, QTreeWidgetItem, QToolTip
+    from PySide6.QtCore import Qt, QEvent, QTimer
     from PySide6.QtGui import QFont
 except ImportError:
     print("❌ PySide6 не установлен")
@@ -37,6 +40,11 @@ try:
 except ImportError as e:
     print(f"⚠️ Root Solution Manager не найден: {e}")
 
+logger = logging.getLogger(__name__)
+
+# Формат консольных сообщений при прямом запуске
+LOG_FORMAT = "%(message)s"
+
 class Solution3DMainWindow(QMainWindow):
     """
     Главное окно 3D-Solution
@@ -58,9 +66,15 @@ class Solution3DMainWindow(QMainWindow):
         
         # Список 3D объектов с типизированными данными
         self.objects_3d: List[SolutionData] = []
+        # Счетчики номеров по префиксу имени ("Куб", "Сфера", ...)
+        self._name_counters = defaultdict(int)
+        # Новые объекты, ожидающие добавления в дерево (одна вставка за проход цикла событий)
+        self._pending_tree_data: List[SolutionData] = []
+        self._pending_flush = False
         
         self.setup_ui()
-        self.create_sample_objects()
+        # Примеры создаются после первой отрисовки пустого окна
+        QTimer.singleShot(0, self.create_sample_objects)
     
     def setup_ui(self):
         """Настройка интерфейса"""
@@ -94,6 +108,9 @@ class Solution3DMainWindow(QMainWindow):
         # Дерево объектов
         self.objects_tree = QTreeWidget()
         self.objects_tree.setHeaderLabels(["Имя", "Тип", "Координаты"])
+        # Подсказки с материалом формируются по запросу (см. eventFilter)
+        self.objects_tree.viewport().installEventFilter(self)
+        self.objects_tree.itemSelectionChanged.connect(self.on_tree_selection_changed)
         layout.addWidget(self.objects_tree)
         
         # Кнопки создания примитивов
@@ -210,31 +227,107 @@ class Solution3DMainWindow(QMainWindow):
             color_rgb=(184, 115, 51)
         )
         
-        self.objects_3d.extend([box_data, sphere_data, cylinder_data])
-        self.update_objects_tree()
+        for obj_data in (box_data, sphere_data, cylinder_data):
+            self.objects_3d.append(obj_data)
+            self._append_tree_item(obj_data)
+        for prefix in ("Куб", "Сфера", "Цилиндр"):
+            self._name_counters[prefix] += 1
     
     def update_objects_tree(self):
         """Обновление дерева объектов с типизированными данными"""
-        self.objects_tree.clear()
-        
-        for obj_data in self.objects_3d:
-            coord = obj_data.properties.coordinate
-            item = QTreeWidgetItem([
-                obj_data.properties.name,
-                obj_data.properties.solution_type.value,
-                f"({coord.x:.1f}, {coord.y:.1f}, {coord.z:.1f})"
-            ])
-            
-            # Добавляем информацию о материале
-            material_info = f"Материал: {obj_data.properties.material.name}"
-            item.setToolTip(2, material_info)
-            
-            self.objects_tree.addTopLevelItem(item)
+        items = [self._make_tree_item(obj_data) for obj_data in self.objects_3d]
+        
+        # Перестраиваем дерево одним пакетом, без промежуточных перерисовок
+        # Полная перестройка уже включает все ожидающие объекты
+        self._pending_tree_data.clear()
+        
+        tree = self.objects_tree
+        tree.setUpdatesEnabled(False)
+        tree.blockSignals(True)
+        try:
+            tree.clear()
+            tree.addTopLevelItems(items)
+        finally:
+            tree.blockSignals(False)
+            tree.setUpdatesEnabled(True)
+    
+    def _next_serial(self, prefix: str) -> int:
+        """Следующий номер для объекта с данным префиксом имени"""
+        self._name_counters[prefix] += 1
+        return self._name_counters[prefix]
+    
+    def _make_tree_item(self, obj_data: SolutionData) -> QTreeWidgetItem:
+        """Создание элемента дерева для объекта"""
+        coord = obj_data.properties.coordinate
+        item = QTreeWidgetItem([
+            obj_data.properties.name,
+            obj_data.properties.solution_type.value,
+            f"({coord.x:.1f}, {coord.y:.1f}, {coord.z:.1f})"
+        ])
+        
+        # Ссылка на данные для подсказки о материале
+        item.setData(0, Qt.UserRole, obj_data)
+        return item
+    
+    def _append_tree_item(self, obj_data: SolutionData):
+        """Добавление в дерево только нового объекта (без полной перестройки)"""
+        self._pending_tree_data.append(obj_data)
+        self._schedule_tree_flush()
+    
+    def _schedule_tree_flush(self):
+        """Откладывает вставку в дерево до следующего прохода цикла событий"""
+        if not self._pending_flush:
+            self._pending_flush = True
+            QTimer.singleShot(0, self._flush_tree)
+    
+    def _flush_tree(self):
+        """Вставляет накопленные объекты в дерево одним пакетом"""
+        self._pending_flush = False
+        if not self._pending_tree_data:
+            return
+        
+        items = [self._make_tree_item(obj_data) for obj_data in self._pending_tree_data]
+        self._pending_tree_data.clear()
+        
+        tree = self.objects_tree
+        tree.setUpdatesEnabled(False)
+        try:
+            tree.addTopLevelItems(items)
+        finally:
+            tree.setUpdatesEnabled(True)
+    
+    def on_tree_selection_changed(self):
+        """Показ свойств выбранного объекта (данные берутся прямо из элемента дерева)"""
+        item = self.objects_tree.currentItem()
+        if item is None:
+            return
+        
+        obj_data = item.data(0, Qt.UserRole)
+        props = obj_data.properties
+        coord = props.coordinate
+        self.info_label.setText(
+            f"Имя: {props.name}\n"
+            f"Тип: {props.solution_type.value}\n"
+            f"Координаты: ({coord.x:.1f}, {coord.y:.1f}, {coord.z:.1f})\n"
+            f"Материал: {props.material.name}"
+        )
+    
+    def eventFilter(self, watched, event):
+        """Показ подсказки о материале только при наведении на колонку координат"""
+        if event.type() == QEvent.ToolTip and watched is self.objects_tree.viewport():
+            item = self.objects_tree.itemAt(event.pos())
+            if item is not None and self.objects_tree.columnAt(event.pos().x()) == 2:
+                obj_data = item.data(0, Qt.UserRole)
+                QToolTip.showText(event.globalPos(), f"Материал: {obj_data.properties.material.name}", self.objects_tree)
+            else:
+                QToolTip.hideText()
+            return True
+        return super().eventFilter(watched, event)
     
     # Методы создания примитивов с типизированными данными
     def create_box(self):
         """Создание куба с типизированными данными"""
-        count = len([o for o in self.objects_3d if "Куб" in o.properties.name]) + 1
+        count = self._next_serial("Куб")
         
         box_data = SolutionDataUtils.create_minimal_solution_data(
             name=f"Куб {count}",
@@ -251,15 +344,17 @@ class Solution3DMainWindow(QMainWindow):
         )
         
         self.objects_3d.append(box_data)
-        self.update_objects_tree()
+        self._append_tree_item(box_data)
         
-        coord = box_data.properties.coordinate
-        print(f"✅ Создан {box_data.properties.name} в позиции ({coord.x}, {coord.y}, {coord.z})")
-        print(f"   Объем: {box_data.dimensions.get_volume_box():.2f} куб.ед.")
+        if logger.isEnabledFor(logging.INFO):
+            coord = box_data.properties.coordinate
+            logger.info("Создан %s в позиции (%s, %s, %s), объем: %.2f куб.ед.",
+                        box_data.properties.name, coord.x, coord.y, coord.z,
+                        box_data.dimensions.get_volume_box())
     
     def create_sphere(self):
         """Создание сферы с типизированными данными"""
-        count = len([o for o in self.objects_3d if "Сфера" in o.properties.name]) + 1
+        count = self._next_serial("Сфера")
         
         sphere_data = SolutionDataUtils.create_minimal_solution_data(
             name=f"Сфера {count}",
@@ -274,15 +369,17 @@ class Solution3DMainWindow(QMainWindow):
         )
         
         self.objects_3d.append(sphere_data)
-        self.update_objects_tree()
+        self._append_tree_item(sphere_data)
         
-        coord = sphere_data.properties.coordinate
-        print(f"✅ Создана {sphere_data.properties.name} в позиции ({coord.x}, {coord.y}, {coord.z})")
-        print(f"   Объем: {sphere_data.dimensions.get_volume_sphere():.2f} куб.ед.")
+        if logger.isEnabledFor(logging.INFO):
+            coord = sphere_data.properties.coordinate
+            logger.info("Создана %s в позиции (%s, %s, %s), объем: %.2f куб.ед.",
+                        sphere_data.properties.name, coord.x, coord.y, coord.z,
+                        sphere_data.dimensions.get_volume_sphere())
     
     def create_cylinder(self):
         """Создание цилиндра с типизированными данными"""
-        count = len([o for o in self.objects_3d if "Цилиндр" in o.properties.name]) + 1
+        count = self._next_serial("Цилиндр")
         
         cylinder_data = SolutionDataUtils.create_minimal_solution_data(
             name=f"Цилиндр {count}",
@@ -298,15 +395,17 @@ class Solution3DMainWindow(QMainWindow):
         )
         
         self.objects_3d.append(cylinder_data)
-        self.update_objects_tree()
+        self._append_tree_item(cylinder_data)
         
-        coord = cylinder_data.properties.coordinate
-        print(f"✅ Создан {cylinder_data.properties.name} в позиции ({coord.x}, {coord.y}, {coord.z})")
-        print(f"   Объем: {cylinder_data.dimensions.get_volume_cylinder():.2f} куб.ед.")
+        if logger.isEnabledFor(logging.INFO):
+            coord = cylinder_data.properties.coordinate
+            logger.info("Создан %s в позиции (%s, %s, %s), объем: %.2f куб.ед.",
+                        cylinder_data.properties.name, coord.x, coord.y, coord.z,
+                        cylinder_data.dimensions.get_volume_cylinder())
     
     def create_cone(self):
         """Создание конуса с типизированными данными"""
-        count = len([o for o in self.objects_3d if "Конус" in o.properties.name]) + 1
+        count = self._next_serial("Конус")
         
         cone_data = SolutionDataUtils.create_minimal_solution_data(
             name=f"Конус {count}",
@@ -322,14 +421,19 @@ class Solution3DMainWindow(QMainWindow):
         )
         
         self.objects_3d.append(cone_data)
-        self.update_objects_tree()
+        self._append_tree_item(cone_data)
         
-        coord = cone_data.properties.coordinate
-        print(f"✅ Создан {cone_data.properties.name} в позиции ({coord.x}, {coord.y}, {coord.z})")
+        if logger.isEnabledFor(logging.INFO):
+            coord = cone_data.properties.coordinate
+            logger.info("Создан %s в позиции (%s, %s, %s)",
+                        cone_data.properties.name, coord.x, coord.y, coord.z)
 
 def launch_3d_solution():
     """Запуск 3D-Solution"""
-    print("🎯 Запуск 3D-Solution...")
+    # Сообщения о запуске и создании объектов видны в консоли (как раньше print);
+    # если логирование уже настроено вызывающим приложением, ничего не меняется
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+    logger.info("Запуск 3D-Solution...")
     
     app = QApplication.instance()
     if app is None:
@@ -6,9 +6,10 @@ Real 3D visualization with OpenCASCADE
 
 import sys
 import os
+from contextlib import contextmanager
 from typing import List, Optional, Dict, Any
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QSlider
-from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtCore import Qt, QTimer, Signal, QObject, QRunnable, QThreadPool
 from PySide6.QtGui import QFont
 
 # Add project paths
@@ -19,7 +20,7 @@ sys.path.insert(0, project_root)
 try:
     from OCC.Display.backend import load_backend
     from OCC.Display.SimpleGui import init_display
-    from OCC.Core.AIS import AIS_Shape, AIS_Line, AIS_Point
+    from OCC.Core.AIS import AIS_Shape, AIS_ColoredShape, AIS_Line, AIS_Point
     from OCC.Core.Quantity import Quantity_Color, Quantity_TOC_RGB
     from OCC.Core.Graphic3d import Graphic3d_MaterialAspect, Graphic3d_NOM_METALIZED
     from OCC.Core.Aspect import Aspect_TOL_SOLID, Aspect_TOL_DASH, Aspect_TOL_DOT
@@ -33,7 +34,8 @@ try:
     from OCC.Core.GProp import GProp_GProps
     from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox, BRepPrimAPI_MakeSphere, BRepPrimAPI_MakeCylinder
     from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_Transform, BRepBuilderAPI_MakeEdge
-    from OCC.Core.TopoDS import TopoDS_Shape
+    from OCC.Core.TopoDS import TopoDS_Shape, TopoDS_Compound
+    from OCC.Core.BRep import BRep_Builder
     
     # Import visualization system
     try:
@@ -86,73 +88,81 @@ if not VISUALIZATION_AVAILABLE:
 
 # Define fallback classes for when OpenCASCADE is not available
 if not OCC_AVAILABLE:
-    class Quantity_Color:
-        def __init__(self, r, g, b, toc):
-            self.r = r
-            self.g = g
-            self.b = b
-            self.toc = toc
-    
-    class Quantity_TOC_RGB:
-        pass
-    
-    class Graphic3d_MaterialAspect:
-        def __init__(self, material_type):
-            self.material_type = material_type
-        
-        def SetColor(self, color):
-            pass
-        
-        def SetTransparency(self, transparency):
+    class _OCCStub:
+        """No-op stand-in for OCC classes and constants: accepts any arguments,
+        every method call does nothing and returns another stub"""
+        def __init__(self, *args, **kwargs):
             pass
-    
-    class Graphic3d_NOM_METALIZED:
-        pass
-    
-    class Aspect_TOL_SOLID:
-        pass
-    
-    class Aspect_TOL_DASH:
-        pass
-    
-    class Aspect_TOL_DOT:
-        pass
-    
-    class Prs3d_LineAspect:
-        def __init__(self, color, style, width):
-            self.color = color
-            self.style = style
-            self.width = width
-    
-    class AIS_Shape:
-        def __init__(self, shape):
-            self.shape = shape
         
-        def SetColor(self, color):
-            pass
+        def __getattr__(self, name):
+            return _OCCStub
+    
+    Quantity_Color = Quantity_TOC_RGB = _OCCStub
+    Graphic3d_MaterialAspect = Graphic3d_NOM_METALIZED = _OCCStub
+    Aspect_TOL_SOLID = Aspect_TOL_DASH = Aspect_TOL_DOT = _OCCStub
+    Prs3d_LineAspect = AIS_Shape = AIS_ColoredShape = TopoDS_Shape = _OCCStub
+    gp_Pnt = BRepBuilderAPI_MakeEdge = _OCCStub
+    TopoDS_Compound = BRep_Builder = _OCCStub
+
+# Show a test cube on startup to check the display (set THESOLUTION_DEBUG=1)
+DEBUG_TEST_CUBE = bool(os.environ.get("THESOLUTION_DEBUG"))
+
+# Coordinate axes: end point (from origin) and RGB color - X red, Y green, Z blue
+AXIS_ENDS_AND_COLORS = (
+    ((10, 0, 0), (1.0, 0.0, 0.0)),
+    ((0, 10, 0), (0.0, 1.0, 0.0)),
+    ((0, 0, 10), (0.0, 0.0, 1.0)),
+)
+
+def build_grid_geometry():
+    """Grid lines as one compound (pure geometry, safe off the GUI thread)"""
+    grid = TopoDS_Compound()
+    builder = BRep_Builder()
+    builder.MakeCompound(grid)
+    
+    for i in range(-10, 11):
+        if i == 0:
+            continue  # Skip center lines
         
-        def SetMaterial(self, material):
-            pass
+        # Vertical lines (parallel to Y-axis)
+        builder.Add(grid, BRepBuilderAPI_MakeEdge(gp_Pnt(i, -10, 0), gp_Pnt(i, 10, 0)).Edge())
         
-        def SetLineAspect(self, aspect):
-            pass
+        # Horizontal lines (parallel to X-axis)
+        builder.Add(grid, BRepBuilderAPI_MakeEdge(gp_Pnt(-10, i, 0), gp_Pnt(10, i, 0)).Edge())
     
-    class TopoDS_Shape:
-        pass
+    return grid
+
+def build_axes_geometry():
+    """Axes compound and [(edge, rgb), ...] (pure geometry, safe off the GUI thread)"""
+    axes = TopoDS_Compound()
+    builder = BRep_Builder()
+    builder.MakeCompound(axes)
+    
+    origin = gp_Pnt(0, 0, 0)
+    edges = []
+    for end, rgb in AXIS_ENDS_AND_COLORS:
+        edge = BRepBuilderAPI_MakeEdge(origin, gp_Pnt(*end)).Edge()
+        builder.Add(axes, edge)
+        edges.append((edge, rgb))
+    
+    return axes, edges
+
+class _OCCGeometrySignals(QObject):
+    """Signals emitted by _OCCGeometryWorker (QRunnable is not a QObject)"""
+    geometry_ready = Signal(object, object)  # grid compound, (axes compound, edges)
+
+class _OCCGeometryWorker(QRunnable):
+    """Pool task building grid and axes geometry; AIS/display work stays on the GUI thread"""
     
-    class gp_Pnt:
-        def __init__(self, x, y, z):
-            self.x = x
-            self.y = y
-            self.z = z
+    def __init__(self):
+        super().__init__()
+        self.signals = _OCCGeometrySignals()
     
-    class BRepBuilderAPI_MakeEdge:
-        def __init__(self, start, end):
-            self.start = start
-            self.end = end
-        
-        def Edge(self):
-            return TopoDS_Shape()
+    def run(self):
+        try:
+            self.signals.geometry_ready.emit(build_grid_geometry(), build_axes_geometry())
+        except Exception as e:
+            print(f"Warning: Failed to build grid/axes geometry: {e}")
 
 class OCC3DViewWidget(QWidget):
     """OpenCASCADE 3D View Widget"""
@@ -167,6 +177,14 @@ class OCC3DViewWidget(QWidget):
         self.context = None
         self.viewer = None
         self.ais_shapes = {}  # Dictionary to store AIS_Shape objects
+        self.grid_ais = None  # All grid lines as one compound AIS_Shape
+        self.axes_ais = None  # X/Y/Z axes as one compound AIS_ColoredShape
+        self._grid_geometry = None  # Prebuilt off the GUI thread by _OCCGeometryWorker
+        self._axes_geometry = None
+        self._geometry_worker = None  # Kept alive until its signal is delivered
+        self._batch_depth = 0  # Nesting level of batch_updates()
+        self._needs_fit = False  # FitAll deferred to the end of the batch
+        self._auto_fit_first = True  # Only the first added shape fits the view automatically
         self.visualization = None
         self.current_settings = {}
         
@@ -216,14 +234,12 @@ class OCC3DViewWidget(QWidget):
         # Grid controls
         self.grid_btn = QPushButton("Grid")
         self.grid_btn.setCheckable(True)
-        self.grid_btn.setChecked(True)
         self.grid_btn.clicked.connect(self.toggle_grid)
         control_layout.addWidget(self.grid_btn)
         
         # Axes controls
         self.axes_btn = QPushButton("Axes")
         self.axes_btn.setCheckable(True)
-        self.axes_btn.setChecked(True)
         self.axes_btn.clicked.connect(self.toggle_axes)
         control_layout.addWidget(self.axes_btn)
         
@@ -234,6 +250,20 @@ class OCC3DViewWidget(QWidget):
         self.status_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.status_label)
     
+    @contextmanager
+    def batch_updates(self):
+        """Defer viewer redraws and FitAll until the outermost block exits (reentrant)"""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self.context:
+                self.context.UpdateCurrentViewer()
+                if self._needs_fit:
+                    self.display.View.FitAll()
+                self._needs_fit = False
+    
     def initialize_occ_display(self):
         """Initialize OpenCASCADE display"""
         if not OCC_AVAILABLE:
@@ -262,11 +292,11 @@ class OCC3DViewWidget(QWidget):
             # Setup display
             self.setup_display()
             
-            # Create coordinate system
-            self.create_coordinate_system()
-            
-            # Create grid
-            self.create_grid()
+            # Grid/axes geometry is built on a pool thread; they are displayed
+            # on first toggle (see toggle_grid/toggle_axes)
+            self._geometry_worker = _OCCGeometryWorker()
+            self._geometry_worker.signals.geometry_ready.connect(self._on_geometry_ready)
+            QThreadPool.globalInstance().start(self._geometry_worker)
             
             # Replace our view widget with the OpenCASCADE widget
             if hasattr(self.display, 'GetWidget'):
@@ -284,13 +314,22 @@ class OCC3DViewWidget(QWidget):
             self.status_label.setText("✅ 3D View: Ready")
             print("✅ OpenCASCADE 3D view initialized successfully")
             
-            # Add a test cube to verify display is working
-            self.add_test_cube()
+            # Add a test cube to verify display is working (debug only)
+            if DEBUG_TEST_CUBE:
+                self.add_test_cube()
             
         except Exception as e:
             self.status_label.setText(f"❌ Failed to initialize 3D view: {e}")
             print(f"❌ Failed to initialize OpenCASCADE display: {e}")
     
+    def _on_geometry_ready(self, grid_geometry, axes_geometry):
+        """Store geometry prebuilt on the pool thread (unless a toggle already built it)"""
+        if self._grid_geometry is None:
+            self._grid_geometry = grid_geometry
+        if self._axes_geometry is None:
+            self._axes_geometry = axes_geometry
+        self._geometry_worker = None
+    
     def add_test_cube(self):
         """Add a test cube to verify 3D view is working"""
         if not self.display or not self.context:
@@ -350,35 +389,17 @@ class OCC3DViewWidget(QWidget):
             return
         
         try:
-            # Create axes
-            from OCC.Core.gp import gp_Pnt, gp_Dir, gp_Ax2
-            from OCC.Core.Geom import Geom_CartesianPoint
-            from OCC.Core.GeomAPI import GeomAPI_PointsToBSpline
-            from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_MakeVertex, BRepBuilderAPI_MakeEdge
-            
-            # Origin point
-            origin = gp_Pnt(0, 0, 0)
-            
-            # X-axis (Red)
-            x_end = gp_Pnt(10, 0, 0)
-            x_edge = BRepBuilderAPI_MakeEdge(origin, x_end).Edge()
-            x_ais = AIS_Shape(x_edge)
-            x_ais.SetColor(Quantity_Color(1.0, 0.0, 0.0, Quantity_TOC_RGB))
-            self.context.Display(x_ais, True)
+            # Geometry is usually prebuilt by _OCCGeometryWorker
+            if self._axes_geometry is None:
+                self._axes_geometry = build_axes_geometry()
+            axes, edges = self._axes_geometry
             
-            # Y-axis (Green)
-            y_end = gp_Pnt(0, 10, 0)
-            y_edge = BRepBuilderAPI_MakeEdge(origin, y_end).Edge()
-            y_ais = AIS_Shape(y_edge)
-            y_ais.SetColor(Quantity_Color(0.0, 1.0, 0.0, Quantity_TOC_RGB))
-            self.context.Display(y_ais, True)
+            # One presentation for all three axes; per-axis colors via AIS_ColoredShape
+            self.axes_ais = AIS_ColoredShape(axes)
+            for edge, rgb in edges:
+                self.axes_ais.SetCustomColor(edge, Quantity_Color(*rgb, Quantity_TOC_RGB))
             
-            # Z-axis (Blue)
-            z_end = gp_Pnt(0, 0, 10)
-            z_edge = BRepBuilderAPI_MakeEdge(origin, z_end).Edge()
-            z_ais = AIS_Shape(z_edge)
-            z_ais.SetColor(Quantity_Color(0.0, 0.0, 1.0, Quantity_TOC_RGB))
-            self.context.Display(z_ais, True)
+            self.context.Display(self.axes_ais, self._batch_depth == 0)
             
         except Exception as e:
             print(f"Warning: Failed to create coordinate system: {e}")
@@ -389,26 +410,14 @@ class OCC3DViewWidget(QWidget):
             return
         
         try:
-            # Create grid lines
-            for i in range(-10, 11):
-                if i == 0:
-                    continue  # Skip center lines
-                
-                # Vertical lines (parallel to Y-axis)
-                start = gp_Pnt(i, -10, 0)
-                end = gp_Pnt(i, 10, 0)
-                edge = BRepBuilderAPI_MakeEdge(start, end).Edge()
-                ais = AIS_Shape(edge)
-                ais.SetColor(Quantity_Color(0.3, 0.3, 0.3, Quantity_TOC_RGB))
-                self.context.Display(ais, True)
-                
-                # Horizontal lines (parallel to X-axis)
-                start = gp_Pnt(-10, i, 0)
-                end = gp_Pnt(10, i, 0)
-                edge = BRepBuilderAPI_MakeEdge(start, end).Edge()
-                ais = AIS_Shape(edge)
-                ais.SetColor(Quantity_Color(0.3, 0.3, 0.3, Quantity_TOC_RGB))
-                self.context.Display(ais, True)
+            # Geometry is usually prebuilt by _OCCGeometryWorker
+            if self._grid_geometry is None:
+                self._grid_geometry = build_grid_geometry()
+            
+            # One presentation, one redraw for all grid lines
+            self.grid_ais = AIS_Shape(self._grid_geometry)
+            self.grid_ais.SetColor(Quantity_Color(0.3, 0.3, 0.3, Quantity_TOC_RGB))
+            self.context.Display(self.grid_ais, self._batch_depth == 0)
                 
         except Exception as e:
             print(f"Warning: Failed to create grid: {e}")
@@ -419,7 +428,7 @@ class OCC3DViewWidget(QWidget):
                   line_style: LineStyle = LineStyle.SOLID,
                   gradient_type: GradientType = GradientType.NONE,
                   transparency: float = 0.0) -> bool:
-        """Add shape to 3D view"""
+        """Add shape to 3D view (does not refit the view; call fit_all() after bulk loads)"""
         if not self.display or not self.context:
             return False
         
@@ -438,11 +447,18 @@ class OCC3DViewWidget(QWidget):
                 # Store in dictionary
                 self.ais_shapes[object_id] = ais_shape
                 
-                # Display in context
-                self.context.Display(ais_shape, True)
+                # Display in context (redraw and fit are deferred inside batch_updates)
+                update = self._batch_depth == 0
+                self.context.Display(ais_shape, update)
                 
-                # Update view
-                self.display.View.FitAll()
+                # Fit the view to the first object only; bulk loaders wrap
+                # add_shape calls in batch_updates() and call fit_all() once
+                if self._auto_fit_first:
+                    self._auto_fit_first = False
+                    if update:
+                        self.display.View.FitAll()
+                    else:
+                        self._needs_fit = True
                 
                 self.status_label.setText(f"✅ Added object: {object_id}")
                 return True
@@ -455,13 +471,17 @@ class OCC3DViewWidget(QWidget):
     
     def remove_shape(self, object_id: str) -> bool:
         """Remove shape from 3D view"""
-        if not self.context or object_id not in self.ais_shapes:
+        if not self.context:
+            return False
+        
+        ais_shape = self.ais_shapes.pop(object_id, None)
+        if ais_shape is None:
             return False
         
         try:
-            ais_shape = self.ais_shapes[object_id]
-            self.context.Erase(ais_shape, True)
-            del self.ais_shapes[object_id]
+            self.context.Erase(ais_shape, self._batch_depth == 0)
+            if self.visualization:
+                self.visualization.forget_style(ais_shape)
             
             self.status_label.setText(f"✅ Removed object: {object_id}")
             return True
@@ -474,16 +494,18 @@ class OCC3DViewWidget(QWidget):
     
     def update_shape_visualization(self, object_id: str, settings: Dict[str, Any]) -> bool:
         """Update shape visualization with new settings"""
-        if not self.context or object_id not in self.ais_shapes:
+        if not self.context:
+            return False
+        
+        ais_shape = self.ais_shapes.get(object_id)
+        if ais_shape is None:
             return False
         
         try:
-            ais_shape = self.ais_shapes[object_id]
-            
             if self.visualization:
                 self.visualization.apply_visualization_style(ais_shape, settings)
             
-            self.context.Update(ais_shape, True)
+            self.context.Update(ais_shape, self._batch_depth == 0)
             self.status_label.setText(f"✅ Updated visualization: {object_id}")
             return True
             
@@ -499,8 +521,15 @@ class OCC3DViewWidget(QWidget):
             return
         
         try:
-            self.context.RemoveAll(True)
-            self.ais_shapes.clear()
+            # Erase/remove without redraws; batch_updates() redraws once on exit
+            with self.batch_updates():
+                self.context.EraseAll(False)
+                self.context.RemoveAll(False)
+                self.ais_shapes.clear()
+                if self.visualization:
+                    self.visualization.forget_style()
+                self._needs_fit = False  # Nothing left to fit
+                self._auto_fit_first = True  # Next shape added fits the empty view again
             self.status_label.setText("✅ Cleared all objects")
             
         except Exception as e:
@@ -542,12 +571,26 @@ class OCC3DViewWidget(QWidget):
     
     def toggle_grid(self):
         """Toggle grid display"""
-        # Implementation depends on how grid is stored
+        if self.context:
+            if self.grid_btn.isChecked():
+                if self.grid_ais is None:
+                    self.create_grid()  # Built lazily on first use
+                else:
+                    self.context.Display(self.grid_ais, True)
+            elif self.grid_ais is not None:
+                self.context.Erase(self.grid_ais, True)
         self.status_label.setText("Grid toggle: " + ("ON" if self.grid_btn.isChecked() else "OFF"))
     
     def toggle_axes(self):
         """Toggle coordinate axes display"""
-        # Implementation depends on how axes are stored
+        if self.context:
+            if self.axes_btn.isChecked():
+                if self.axes_ais is None:
+                    self.create_coordinate_system()  # Built lazily on first use
+                else:
+                    self.context.Display(self.axes_ais, True)
+            elif self.axes_ais is not None:
+                self.context.Erase(self.axes_ais, True)
         self.status_label.setText("Axes toggle: " + ("ON" if self.axes_btn.isChecked() else "OFF"))
     
     def get_view_widget(self) -> QWidget:
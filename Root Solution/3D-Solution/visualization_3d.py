@@ -9,6 +9,8 @@ import os
 from typing import Dict, List, Tuple, Optional, Any
 from enum import Enum
 import math
+import weakref
+from functools import lru_cache
 
 # Add project paths
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -26,8 +28,8 @@ try:
     from OCC.Core.BRepAdaptor import BRepAdaptor_Surface
     from OCC.Core.GeomAbs import GeomAbs_Plane, GeomAbs_Cylinder, GeomAbs_Sphere
     from OCC.Core.gp import gp_Pnt, gp_Vec, gp_Dir
-    from OCC.Core.BRepGProp import brepgprop_VolumeProperties
-    from OCC.Core.GProp import GProp_GProps
+    from OCC.Core.Bnd import Bnd_Box
+    from OCC.Core.BRepBndLib import brepbndlib_Add
     VISUALIZATION_AVAILABLE = True
     print("✅ OpenCASCADE visualization system imported successfully")
 except ImportError:
@@ -86,6 +88,39 @@ except ImportError:
         def SetLineAspect(self, aspect):
             pass
 
+# Colors are rounded to this many digits before caching, so near-equal floats share one object
+COLOR_CACHE_PRECISION = 3
+
+def _round_rgb(rgb: Tuple[float, float, float]) -> Tuple[float, float, float]:
+    """RGB rounded to COLOR_CACHE_PRECISION digits - the cache key for colors"""
+    return (round(rgb[0], COLOR_CACHE_PRECISION),
+            round(rgb[1], COLOR_CACHE_PRECISION),
+            round(rgb[2], COLOR_CACHE_PRECISION))
+
+@lru_cache(maxsize=256)
+def _color(r: float, g: float, b: float) -> Quantity_Color:
+    """Shared Quantity_Color for an RGB triple (never mutate the result)"""
+    return Quantity_Color(r, g, b, Quantity_TOC_RGB)
+
+def _to_color(rgb: Tuple[float, float, float]) -> Quantity_Color:
+    """Cached Quantity_Color for an (r, g, b) tuple"""
+    return _color(*_round_rgb(rgb))
+
+@lru_cache(maxsize=64)
+def _cached_material(material, rgb: Optional[Tuple[float, float, float]],
+                     transparency: float) -> Graphic3d_MaterialAspect:
+    """Configured Graphic3d_MaterialAspect per (OCC material, color, transparency)
+    
+    SetMaterial copies the aspect, so one instance can serve many shapes as
+    long as nobody mutates the result.
+    """
+    aspect = Graphic3d_MaterialAspect(material)
+    if rgb:
+        aspect.SetColor(_color(*rgb))
+    if transparency > 0.0:
+        aspect.SetTransparency(transparency)
+    return aspect
+
 class LineStyle(Enum):
     """Line styles for 3D visualization"""
     SOLID = "Solid"
@@ -121,38 +156,68 @@ class ColorScheme(Enum):
     TECHNICAL = "Technical"
     ARTISTIC = "Artistic"
 
+# Brightness factor per gradient type for a single point (plain float math)
+GRADIENT_FACTORS = {
+    # Linear gradient based on X position
+    GradientType.LINEAR: lambda x, y, z: 0.5 + 0.5 * ((x + 1.0) / 2.0),
+    # Radial gradient from center
+    GradientType.RADIAL: lambda x, y, z: 1.0 - 0.3 * min(1.0, math.sqrt(x*x + y*y) / 2.0),
+    # Conical gradient based on angle
+    GradientType.CONICAL: lambda x, y, z: 0.7 + 0.3 * ((math.atan2(y, x) + math.pi) / (2 * math.pi)),
+    # Spherical gradient based on distance from origin
+    GradientType.SPHERICAL: lambda x, y, z: 0.8 + 0.2 * min(1.0, math.sqrt(x*x + y*y + z*z) / 2.0),
+}
+
+# Below this many points numpy call overhead outweighs vectorization
+GRADIENT_BATCH_MIN_POINTS = 64
+
+@lru_cache(maxsize=None)
+def _gradient_kernels() -> Dict[GradientType, Any]:
+    """Same factors vectorized over coordinate arrays, for bulk callers
+    
+    Built on first use so numpy is not imported on the GUI startup path.
+    """
+    import numpy as np
+    return {
+        # Linear gradient based on X position
+        GradientType.LINEAR: lambda x, y, z: 0.5 + 0.5 * ((x + 1.0) / 2.0),
+        # Radial gradient from center
+        GradientType.RADIAL: lambda x, y, z: 1.0 - 0.3 * np.minimum(1.0, np.hypot(x, y) / 2.0),
+        # Conical gradient based on angle
+        GradientType.CONICAL: lambda x, y, z: 0.7 + 0.3 * ((np.arctan2(y, x) + np.pi) / (2 * np.pi)),
+        # Spherical gradient based on distance from origin
+        GradientType.SPHERICAL: lambda x, y, z: 0.8 + 0.2 * np.minimum(1.0, np.sqrt(x*x + y*y + z*z) / 2.0),
+    }
+
+# Enum -> OCC constant tables, resolved once at import
+LINE_STYLES = {
+    LineStyle.SOLID: Aspect_TOL_SOLID,
+    LineStyle.DASHED: Aspect_TOL_DASH,
+    LineStyle.DOTTED: Aspect_TOL_DOT,
+    LineStyle.DASH_DOT: Aspect_TOL_DASH,
+    LineStyle.LONG_DASH: Aspect_TOL_DASH,
+    LineStyle.DOUBLE_DASH: Aspect_TOL_DASH
+}
+
+# Material types with fallbacks to METALIZED where OCC lacks the material
+MATERIAL_TYPES = {
+    MaterialType.METAL: Graphic3d_NOM_METALIZED,
+    MaterialType.PLASTIC: getattr(Graphic3d_MaterialAspect, 'Graphic3d_NOM_PLASTIC', Graphic3d_NOM_METALIZED),
+    MaterialType.GLASS: getattr(Graphic3d_MaterialAspect, 'Graphic3d_NOM_GLASS', Graphic3d_NOM_METALIZED),
+    MaterialType.WOOD: getattr(Graphic3d_MaterialAspect, 'Graphic3d_NOM_WOOD', Graphic3d_NOM_METALIZED),
+    MaterialType.STONE: getattr(Graphic3d_MaterialAspect, 'Graphic3d_NOM_STONE', Graphic3d_NOM_METALIZED)
+}
+
 class Visualization3D:
     """Main 3D visualization system"""
     
     def __init__(self):
-        self.line_styles = {
-            LineStyle.SOLID: Aspect_TOL_SOLID,
-            LineStyle.DASHED: Aspect_TOL_DASH,
-            LineStyle.DOTTED: Aspect_TOL_DOT,
-            LineStyle.DASH_DOT: Aspect_TOL_DASH,
-            LineStyle.LONG_DASH: Aspect_TOL_DASH,
-            LineStyle.DOUBLE_DASH: Aspect_TOL_DASH
-        }
+        self.line_styles = dict(LINE_STYLES)
+        self.material_types = dict(MATERIAL_TYPES)
         
-        # Define material types with fallbacks
-        self.material_types = {}
-        try:
-            self.material_types = {
-                MaterialType.METAL: Graphic3d_NOM_METALIZED,
-                MaterialType.PLASTIC: getattr(Graphic3d_MaterialAspect, 'Graphic3d_NOM_PLASTIC', Graphic3d_NOM_METALIZED),
-                MaterialType.GLASS: getattr(Graphic3d_MaterialAspect, 'Graphic3d_NOM_GLASS', Graphic3d_NOM_METALIZED),
-                MaterialType.WOOD: getattr(Graphic3d_MaterialAspect, 'Graphic3d_NOM_WOOD', Graphic3d_NOM_METALIZED),
-                MaterialType.STONE: getattr(Graphic3d_MaterialAspect, 'Graphic3d_NOM_STONE', Graphic3d_NOM_METALIZED)
-            }
-        except AttributeError:
-            # Fallback to basic material types
-            self.material_types = {
-                MaterialType.METAL: Graphic3d_NOM_METALIZED,
-                MaterialType.PLASTIC: Graphic3d_NOM_METALIZED,
-                MaterialType.GLASS: Graphic3d_NOM_METALIZED,
-                MaterialType.WOOD: Graphic3d_NOM_METALIZED,
-                MaterialType.STONE: Graphic3d_NOM_METALIZED
-            }
+        # Hash of the last style applied to each AIS_Shape, keyed weakly by the
+        # shape itself so a collected shape's id cannot be reused
+        self._last_style = weakref.WeakKeyDictionary()
         
         self.color_schemes = {
             ColorScheme.CLASSIC: {
@@ -193,115 +258,103 @@ class Visualization3D:
             }
         }
     
+    @staticmethod
+    def clear_aspect_caches():
+        """Drop cached colors and materials (e.g. after changing OCC defaults)"""
+        _color.cache_clear()
+        _cached_material.cache_clear()
+    
+    def create_gradient_colors_batch(self, base_color: Tuple[float, float, float],
+                                     gradient_type: GradientType,
+                                     positions: Any) -> Any:
+        """Gradient RGB for many positions at once: (N, 3) positions -> (N, 3) numpy array"""
+        import numpy as np
+        
+        positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+        base = np.asarray(base_color, dtype=float)
+        
+        if len(positions) < GRADIENT_BATCH_MIN_POINTS:
+            return np.array([self._gradient_rgb(base_color, gradient_type, tuple(p))
+                             for p in positions.tolist()]).reshape(-1, 3)
+        
+        kernel = _gradient_kernels().get(gradient_type)
+        if kernel is None:
+            return np.tile(base, (len(positions), 1))
+        
+        x, y, z = positions.T
+        return kernel(x, y, z)[:, np.newaxis] * base
+    
+    @staticmethod
+    def _gradient_rgb(base_color: Tuple[float, float, float],
+                      gradient_type: GradientType,
+                      position: Tuple[float, float, float]) -> Tuple[float, float, float]:
+        """Gradient RGB for a single position"""
+        factor_fn = GRADIENT_FACTORS.get(gradient_type)
+        if factor_fn is None:
+            return tuple(base_color)
+        
+        factor = factor_fn(*position)
+        r, g, b = base_color
+        return (r * factor, g * factor, b * factor)
+    
     def create_gradient_color(self, base_color: Tuple[float, float, float], 
                             gradient_type: GradientType, 
                             position: Tuple[float, float, float] = (0, 0, 0)) -> Quantity_Color:
         """Create gradient color based on type and position"""
-        if not VISUALIZATION_AVAILABLE:
-            return None
-        
-        r, g, b = base_color
-        
         if gradient_type == GradientType.NONE:
-            return Quantity_Color(r, g, b, Quantity_TOC_RGB)
-        
-        elif gradient_type == GradientType.LINEAR:
-            # Linear gradient based on X position
-            x, y, z = position
-            factor = (x + 1.0) / 2.0  # Normalize to 0-1
-            r = r * (0.5 + 0.5 * factor)
-            g = g * (0.5 + 0.5 * factor)
-            b = b * (0.5 + 0.5 * factor)
-        
-        elif gradient_type == GradientType.RADIAL:
-            # Radial gradient from center
-            x, y, z = position
-            distance = math.sqrt(x*x + y*y)
-            factor = min(1.0, distance / 2.0)
-            r = r * (1.0 - 0.3 * factor)
-            g = g * (1.0 - 0.3 * factor)
-            b = b * (1.0 - 0.3 * factor)
+            return _to_color(base_color)
         
-        elif gradient_type == GradientType.CONICAL:
-            # Conical gradient based on angle
-            x, y, z = position
-            angle = math.atan2(y, x)
-            factor = (angle + math.pi) / (2 * math.pi)
-            r = r * (0.7 + 0.3 * factor)
-            g = g * (0.7 + 0.3 * factor)
-            b = b * (0.7 + 0.3 * factor)
-        
-        elif gradient_type == GradientType.SPHERICAL:
-            # Spherical gradient based on distance from origin
-            x, y, z = position
-            distance = math.sqrt(x*x + y*y + z*z)
-            factor = min(1.0, distance / 2.0)
-            r = r * (0.8 + 0.2 * factor)
-            g = g * (0.8 + 0.2 * factor)
-            b = b * (0.8 + 0.2 * factor)
-        
-        return Quantity_Color(r, g, b, Quantity_TOC_RGB)
+        return _to_color(self._gradient_rgb(base_color, gradient_type, position))
     
     def create_line_aspect(self, color: Tuple[float, float, float], 
                           line_style: LineStyle, 
                           width: float = 1.0) -> Prs3d_LineAspect:
-        """Create line aspect with specified style and color"""
-        if not VISUALIZATION_AVAILABLE:
-            return None
+        """Create line aspect with specified style and color
         
-        occ_color = Quantity_Color(color[0], color[1], color[2], Quantity_TOC_RGB)
-        aspect = Prs3d_LineAspect(occ_color, self.line_styles[line_style], width)
-        return aspect
+        Always a new aspect: SetLineAspect keeps the handle and the shape may
+        recolor it later, so it must not be shared between shapes.
+        """
+        return Prs3d_LineAspect(_to_color(color), self.line_styles[line_style], width)
     
     def create_material_aspect(self, material_type: MaterialType, 
                              color: Tuple[float, float, float] = None,
                              transparency: float = 0.0) -> Graphic3d_MaterialAspect:
         """Create material aspect for 3D objects"""
-        if not VISUALIZATION_AVAILABLE:
-            return None
-        
-        material = Graphic3d_MaterialAspect(self.material_types[material_type])
-        
-        if color:
-            occ_color = Quantity_Color(color[0], color[1], color[2], Quantity_TOC_RGB)
-            material.SetColor(occ_color)
-        
-        if transparency > 0.0:
-            material.SetTransparency(transparency)
-        
-        return material
+        return _cached_material(self.material_types[material_type],
+                                _round_rgb(color) if color else None,
+                                round(transparency, COLOR_CACHE_PRECISION))
     
     def create_ais_shape(self, shape, color: Tuple[float, float, float] = None,
                         material_type: MaterialType = MaterialType.METAL,
                         line_style: LineStyle = LineStyle.SOLID,
                         gradient_type: GradientType = GradientType.NONE,
                         transparency: float = 0.0) -> AIS_Shape:
-        """Create AIS_Shape with specified visualization properties"""
-        if not VISUALIZATION_AVAILABLE:
-            return None
+        """Create AIS_Shape with specified visualization properties
         
-        ais_shape = AIS_Shape(shape)
-        
-        # Set color with gradient
+        The shape is not displayed here; the caller displays it once
+        (the add_shape methods of the 3D views).
+        """
+        # Compute every aspect first, then set them back to back
+        occ_color = None
         if color:
             # For gradient, we need to analyze the shape geometry
             if gradient_type != GradientType.NONE:
                 # Create gradient based on shape bounds
                 bounds = self.get_shape_bounds(shape)
                 center = ((bounds[0] + bounds[1])/2, (bounds[2] + bounds[3])/2, (bounds[4] + bounds[5])/2)
-                gradient_color = self.create_gradient_color(color, gradient_type, center)
-                ais_shape.SetColor(gradient_color)
+                occ_color = self.create_gradient_color(color, gradient_type, center)
             else:
-                occ_color = Quantity_Color(color[0], color[1], color[2], Quantity_TOC_RGB)
-                ais_shape.SetColor(occ_color)
+                occ_color = _to_color(color)
         
-        # Set material
         material = self.create_material_aspect(material_type, color, transparency)
+        line_aspect = self.create_line_aspect(color or (0.8, 0.8, 0.8), line_style)
+        
+        # Least-invalidation order: material -> color -> line aspect
+        ais_shape = AIS_Shape(shape)
         if material:
             ais_shape.SetMaterial(material)
-        
-        # Set line style
-        line_aspect = self.create_line_aspect(color or (0.8, 0.8, 0.8), line_style)
+        if occ_color:
+            ais_shape.SetColor(occ_color)
         if line_aspect:
             ais_shape.SetLineAspect(line_aspect)
         
@@ -309,26 +362,18 @@ class Visualization3D:
     
     def get_shape_bounds(self, shape) -> Tuple[float, float, float, float, float, float]:
         """Get bounding box of shape (xmin, xmax, ymin, ymax, zmin, zmax)"""
-        if not VISUALIZATION_AVAILABLE:
-            return (0, 1, 0, 1, 0, 1)
-        
         try:
-            # Use BRepGProp to get bounding box
-            props = GProp_GProps()
-            brepgprop_VolumeProperties(shape, props)
-            bounds = props.Bounds()
-            return (bounds.XMin(), bounds.XMax(), 
-                   bounds.YMin(), bounds.YMax(), 
-                   bounds.ZMin(), bounds.ZMax())
+            # Bnd_Box only sweeps vertices/curve extrema; volume properties would integrate over faces
+            box = Bnd_Box()
+            brepbndlib_Add(shape, box)
+            xmin, ymin, zmin, xmax, ymax, zmax = box.Get()
+            return (xmin, xmax, ymin, ymax, zmin, zmax)
         except:
             return (0, 1, 0, 1, 0, 1)
     
     def create_coordinate_system(self, size: float = 10.0, 
                                color_scheme: ColorScheme = ColorScheme.CLASSIC) -> List[AIS_Shape]:
         """Create coordinate system axes"""
-        if not VISUALIZATION_AVAILABLE:
-            return []
-        
         colors = self.color_schemes[color_scheme]
         
         # Create axes
@@ -346,9 +391,6 @@ class Visualization3D:
     def create_grid(self, size: float = 20.0, spacing: float = 1.0,
                    color_scheme: ColorScheme = ColorScheme.CLASSIC) -> List[AIS_Shape]:
         """Create grid for 3D visualization"""
-        if not VISUALIZATION_AVAILABLE:
-            return []
-        
         colors = self.color_schemes[color_scheme]
         grid_color = colors['grid']
         
@@ -374,7 +416,17 @@ class Visualization3D:
     def apply_visualization_style(self, ais_shape: AIS_Shape,
                                 style_config: Dict[str, Any]) -> AIS_Shape:
         """Apply comprehensive visualization style to AIS_Shape"""
-        if not VISUALIZATION_AVAILABLE or not ais_shape:
+        if not ais_shape:
+            return ais_shape
+        
+        # Re-applying the same style would only invalidate the presentation
+        style_hash = hash((tuple(style_config.get('color', ())),
+                           style_config.get('material_type'),
+                           style_config.get('line_style'),
+                           style_config.get('gradient_type'),
+                           round(style_config.get('transparency', 0.0), 3),
+                           style_config.get('line_width', 1.0)))
+        if self._last_style.get(ais_shape) == style_hash:
             return ais_shape
         
         # Apply color
@@ -385,8 +437,7 @@ class Visualization3D:
                 gradient_color = self.create_gradient_color(color, gradient_type)
                 ais_shape.SetColor(gradient_color)
             else:
-                occ_color = Quantity_Color(color[0], color[1], color[2], Quantity_TOC_RGB)
-                ais_shape.SetColor(occ_color)
+                ais_shape.SetColor(_to_color(color))
         
         # Apply material
         if 'material_type' in style_config:
@@ -407,8 +458,29 @@ class Visualization3D:
             if line_aspect:
                 ais_shape.SetLineAspect(line_aspect)
         
+        # Recorded only once styling succeeded, so a failed attempt is retried
+        self._last_style[ais_shape] = style_hash
         return ais_shape
 
+    def forget_style(self, ais_shape: Optional[AIS_Shape] = None):
+        """Forget the last applied style of a removed shape (None - of all shapes)"""
+        if ais_shape is None:
+            self._last_style.clear()
+        else:
+            self._last_style.pop(ais_shape, None)
+
+# Without OpenCASCADE the public methods become no-ops once, here, instead of
+# every method checking VISUALIZATION_AVAILABLE on each call
+if not VISUALIZATION_AVAILABLE:
+    Visualization3D.create_gradient_color = lambda self, *args, **kwargs: None
+    Visualization3D.create_line_aspect = lambda self, *args, **kwargs: None
+    Visualization3D.create_material_aspect = lambda self, *args, **kwargs: None
+    Visualization3D.create_ais_shape = lambda self, *args, **kwargs: None
+    Visualization3D.get_shape_bounds = lambda self, shape: (0, 1, 0, 1, 0, 1)
+    Visualization3D.create_coordinate_system = lambda self, *args, **kwargs: []
+    Visualization3D.create_grid = lambda self, *args, **kwargs: []
+    Visualization3D.apply_visualization_style = lambda self, ais_shape, style_config: ais_shape
+
 class VisualizationPresets:
     """Predefined visualization presets"""
     
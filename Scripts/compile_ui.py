@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Build step: compile Qt Designer .ui files to Python with pyside6-uic
+
+Gui/<name>.ui -> Gui/ui_<name>.py. Gui/ui_loader.py uses the generated
+Ui_* classes when present and falls back to QUiLoader otherwise.
+Re-run after editing a form in Qt Designer.
+"""
+
+import sys
+import shutil
+import argparse
+import subprocess
+import logging
+from pathlib import Path
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+GUI_DIR = Path(__file__).resolve().parent.parent / "Gui"
+
+def compile_ui_file(ui_path: Path, uic: str) -> bool:
+    """Compile one .ui file next to itself as ui_<name>.py"""
+    output_path = ui_path.with_name(f"ui_{ui_path.stem}.py")
+    result = subprocess.run([uic, str(ui_path), "-o", str(output_path)],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        logger.error(f"Failed to compile {ui_path.name}: {result.stderr.strip()}")
+        return False
+
+    logger.info(f"Compiled {ui_path.name} -> {output_path.name}")
+    return True
+
+def main():
+    """Main CLI interface"""
+    parser = argparse.ArgumentParser(description='Compile Gui/*.ui files with pyside6-uic')
+    parser.add_argument('--uic', default='pyside6-uic', help='uic executable')
+    parser.add_argument('--gui-dir', default=str(GUI_DIR), help='Directory with .ui files')
+
+    args = parser.parse_args()
+
+    uic = shutil.which(args.uic)
+    if uic is None:
+        logger.error(f"{args.uic} not found (install PySide6)")
+        return 1
+
+    ui_files = sorted(Path(args.gui_dir).glob("*.ui"))
+    if not ui_files:
+        logger.warning(f"No .ui files in {args.gui_dir}")
+        return 0
+
+    failed = [ui_path for ui_path in ui_files if not compile_ui_file(ui_path, uic)]
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
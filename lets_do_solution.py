@@ -4,10 +4,13 @@ Let's Do Solution GUI - Beautiful interface for working with TheSolution CAD sol
 Loads UI file from Qt Designer and provides functionality
 """
 
+import os
 import sys
 import subprocess
+import time
+import threading
+from collections import deque
 from pathlib import Path
-from datetime import datetime
 
 # Add module paths
 project_root = Path(__file__).parent
@@ -16,60 +19,109 @@ sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(project_root / "Root Solution" / "python"))
 
 try:
-    from PySide6.QtWidgets import (QApplication, QMainWindow, QMessageBox, 
-                                   QTreeWidgetItem, QFileDialog)
-    from PySide6.QtCore import Qt, QThread, Signal
-    from PySide6.QtGui import QIcon, QFont
+    from PySide6.QtWidgets import (QApplication, QMainWindow, QMessageBox,
+                                   QTreeWidgetItem, QAbstractButton)
+    from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, Signal
+    from PySide6.QtGui import QIcon, QFont, QTextCursor, QBrush
     from PySide6.QtUiTools import QUiLoader
 except ImportError:
     print("❌ Error: PySide6 is not installed")
     print("Install: pip install PySide6")
     sys.exit(1)
 
-class SolutionWorker(QThread):
-    """Thread for executing solution operations"""
+try:
+    from solution_data_types import SolutionType, SolutionDataUtils, SolutionCoordinate, SolutionMaterial
+except ImportError as e:
+    print(f"❌ Error importing solution data types: {e}")
+    sys.exit(1)
+
+# Qt Designer file for the main window
+UI_FILE_PATH = project_root / "Gui" / "lets_do_solution.ui"
+
+# Maximum number of lines kept in the log widget
+LOG_MAX_BLOCKS = 2000
+LOG_TIMESTAMP_FORMAT = "%H:%M:%S"
+# Interval for flushing buffered log messages to the widget (ms)
+LOG_FLUSH_INTERVAL_MS = 50
+
+# Solution buttons that only show the "not implemented" message
+NOT_IMPLEMENTED_BUTTONS = (
+    'launch2DButton', 'createDrawingsButton',
+    'launchAssemblyButton', 'createAssembliesButton',
+    'launchAnalysisButton', 'analysisButton',
+    'launchSimulationButton', 'simulationButton',
+    'launchManufacturingButton', 'manufacturingButton',
+    'launchDocumentationButton', 'documentationButton',
+    'launchCollaborationButton', 'collaborationButton'
+)
+
+# Background brushes for the solutions tree, by solution status
+ACTIVE_STATUS_BRUSH = QBrush(Qt.green)
+INACTIVE_STATUS_BRUSH = QBrush(Qt.gray)
+
+_ui_loader = None
+
+def get_ui_loader() -> QUiLoader:
+    """Shared QUiLoader (created on first use, GUI thread only)"""
+    global _ui_loader
+    if _ui_loader is None:
+        _ui_loader = QUiLoader()
+    return _ui_loader
+
+class SolutionWorkerSignals(QObject):
+    """Signals emitted by SolutionWorker (QRunnable is not a QObject)"""
     log_signal = Signal(str)
     finished_signal = Signal(bool, str)
+
+class SolutionWorker(QRunnable):
+    """Task for executing solution operations on the shared thread pool"""
     
-    def __init__(self, operation, *args):
+    # Operation name -> handler method name
+    OPERATIONS = {
+        "launch_3d": "launch_3d_solution",
+        "create_3d_objects": "create_3d_objects",
+        "demo": "run_demo",
+        "test": "run_tests",
+        "root_launcher": "launch_root_launcher",
+    }
+    
+    def __init__(self, operation, *args, stop_event=None):
         super().__init__()
         self.operation = operation
         self.args = args
+        self.stop_event = stop_event or threading.Event()
+        self.signals = SolutionWorkerSignals()
+        self.setAutoDelete(True)
     
     def run(self):
+        # Window is closing - skip work nobody will see
+        if self.stop_event.is_set():
+            return
+        
         try:
-            if self.operation == "launch_3d":
-                self.launch_3d_solution()
-            elif self.operation == "create_3d_objects":
-                self.create_3d_objects()
-            elif self.operation == "demo":
-                self.run_demo()
-            elif self.operation == "test":
-                self.run_tests()
-            elif self.operation == "root_launcher":
-                self.launch_root_launcher()
-            else:
-                self.finished_signal.emit(False, f"Unknown operation: {self.operation}")
+            handler_name = self.OPERATIONS.get(self.operation)
+            if handler_name is None:
+                self.signals.finished_signal.emit(False, f"Unknown operation: {self.operation}")
+                return
+            getattr(self, handler_name)()
         except Exception as e:
-            self.finished_signal.emit(False, f"Error: {e}")
+            self.signals.finished_signal.emit(False, f"Error: {e}")
     
     def launch_3d_solution(self):
-        self.log_signal.emit("🎯 Launching 3D-Solution GUI...")
+        self.signals.log_signal.emit("🎯 Launching 3D-Solution GUI...")
         try:
             # Launch 3D-Solution GUI in separate process without blocking
             subprocess.Popen([sys.executable, "Root Solution/3D-Solution/main.py"], 
                            creationflags=subprocess.CREATE_NEW_CONSOLE)
-            self.log_signal.emit("✅ 3D-Solution GUI launched in separate window")
-            self.finished_signal.emit(True, "3D-Solution GUI launched")
+            self.signals.log_signal.emit("✅ 3D-Solution GUI launched in separate window")
+            self.signals.finished_signal.emit(True, "3D-Solution GUI launched")
         except Exception as e:
-            self.log_signal.emit(f"❌ Launch error: {e}")
-            self.finished_signal.emit(False, f"Error: {e}")
+            self.signals.log_signal.emit(f"❌ Launch error: {e}")
+            self.signals.finished_signal.emit(False, f"Error: {e}")
     
     def create_3d_objects(self):
-        self.log_signal.emit("🔸 Creating 3D objects...")
+        self.signals.log_signal.emit("🔸 Creating 3D objects...")
         try:
-            from solution_data_types import SolutionType, SolutionDataUtils, SolutionCoordinate, SolutionMaterial
-            
             # Create a cube
             box = SolutionDataUtils.create_minimal_solution_data(
                 name="My Cube",
@@ -90,41 +142,55 @@ class SolutionWorker(QThread):
             sphere.dimensions.radius = 5.0
             sphere.properties.material = SolutionMaterial(name="Aluminum", density=2.7)
             
-            self.log_signal.emit(f"✅ Created {box.properties.name} - volume: {box.dimensions.get_volume_box():.2f} cubic units")
-            self.log_signal.emit(f"✅ Created {sphere.properties.name} - volume: {sphere.dimensions.get_volume_sphere():.2f} cubic units")
-            self.finished_signal.emit(True, "3D objects created")
+            self.signals.log_signal.emit(f"✅ Created {box.properties.name} - volume: {box.dimensions.get_volume_box():.2f} cubic units")
+            self.signals.log_signal.emit(f"✅ Created {sphere.properties.name} - volume: {sphere.dimensions.get_volume_sphere():.2f} cubic units")
+            self.signals.finished_signal.emit(True, "3D objects created")
             
         except Exception as e:
-            self.log_signal.emit(f"❌ Object creation error: {e}")
-            self.finished_signal.emit(False, f"Error: {e}")
+            self.signals.log_signal.emit(f"❌ Object creation error: {e}")
+            self.signals.finished_signal.emit(False, f"Error: {e}")
     
     def run_demo(self):
-        self.log_signal.emit("🎬 Running demonstration...")
-        self.log_signal.emit("✅ Demonstration completed")
-        self.finished_signal.emit(True, "Demonstration completed")
+        self.signals.log_signal.emit("🎬 Running demonstration...")
+        self.signals.log_signal.emit("✅ Demonstration completed")
+        self.signals.finished_signal.emit(True, "Demonstration completed")
     
     def run_tests(self):
-        self.log_signal.emit("🧪 Running tests...")
-        self.log_signal.emit("✅ Tests passed successfully")
-        self.finished_signal.emit(True, "Tests passed")
+        self.signals.log_signal.emit("🧪 Running tests...")
+        self.signals.log_signal.emit("✅ Tests passed successfully")
+        self.signals.finished_signal.emit(True, "Tests passed")
     
     def launch_root_launcher(self):
-        self.log_signal.emit("🏗️ Launching Root Solution Launcher...")
+        self.signals.log_signal.emit("🏗️ Launching Root Solution Launcher...")
         result = subprocess.run([sys.executable, "Root Solution/main.py"], 
                               capture_output=True, text=True)
         if result.returncode == 0:
-            self.log_signal.emit("✅ Root Solution Launcher launched")
-            self.finished_signal.emit(True, "Root Solution Launcher launched")
+            self.signals.log_signal.emit("✅ Root Solution Launcher launched")
+            self.signals.finished_signal.emit(True, "Root Solution Launcher launched")
         else:
-            self.log_signal.emit(f"❌ Launch error: {result.stderr}")
-            self.finished_signal.emit(False, f"Error: {result.stderr}")
+            self.signals.log_signal.emit(f"❌ Launch error: {result.stderr}")
+            self.signals.finished_signal.emit(False, f"Error: {result.stderr}")
 
 class LetsDoSolutionGUI(QMainWindow):
     """Main Let's Do Solution window"""
     
     def __init__(self):
         super().__init__()
-        self.workers = []  # Store thread references
+        # Shared pool instead of one QThread per operation
+        self.pool = QThreadPool.globalInstance()
+        self.pool.setMaxThreadCount(max(2, (os.cpu_count() or 2) // 2))
+        # Set on close so pending tasks stop cooperatively
+        self._stop_event = threading.Event()
+        
+        # Log messages are buffered and flushed to the widget in batches
+        self._log_buffer = deque()
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.timeout.connect(self._flush_log)
+        
+        # Solutions tree rows by solution name (updated in place on refresh)
+        self._tree_items = {}
+        
         self.load_ui()
         self.setup_connections()
         self.load_solutions_tree()
@@ -133,22 +199,24 @@ class LetsDoSolutionGUI(QMainWindow):
     def load_ui(self):
         """Load UI from file"""
         try:
-            ui_file = Path(__file__).parent / "Gui" / "lets_do_solution.ui"
-            if not ui_file.exists():
-                raise FileNotFoundError(f"UI file not found: {ui_file}")
+            if not UI_FILE_PATH.is_file():
+                raise FileNotFoundError(f"UI file not found: {UI_FILE_PATH}")
             
-            loader = QUiLoader()
-            self.ui = loader.load(str(ui_file))
+            self.ui = get_ui_loader().load(str(UI_FILE_PATH))
             
             if not self.ui:
                 raise RuntimeError("Error loading UI file")
             
-            # Copy all widgets from loaded UI
-            for attr_name in dir(self.ui):
-                if not attr_name.startswith('_'):
-                    setattr(self, attr_name, getattr(self.ui, attr_name))
+            # Expose named widgets from loaded UI (skip Qt internals)
+            self._widgets = {}
+            for child in self.ui.findChildren(QObject):
+                name = child.objectName()
+                if name and not name.startswith('qt_'):
+                    self._widgets[name] = child
+                    setattr(self, name, child)
             
             self.setCentralWidget(self.ui.centralwidget)
+            self.logTextEdit.document().setMaximumBlockCount(LOG_MAX_BLOCKS)
             self.setWindowTitle("TheSolution CAD - Let's Do Solution")
             self.resize(1200, 800)
             
@@ -171,27 +239,14 @@ class LetsDoSolutionGUI(QMainWindow):
         self.refreshButton.clicked.connect(self.load_solutions_tree)
         
         # All other solution buttons (show "not implemented")
-        solution_buttons = [
-            'launch2DButton', 'createDrawingsButton',
-            'launchAssemblyButton', 'createAssembliesButton',
-            'launchAnalysisButton', 'analysisButton',
-            'launchSimulationButton', 'simulationButton',
-            'launchManufacturingButton', 'manufacturingButton',
-            'launchDocumentationButton', 'documentationButton',
-            'launchCollaborationButton', 'collaborationButton'
-        ]
-        
-        for button_name in solution_buttons:
-            if hasattr(self, button_name):
-                button = getattr(self, button_name)
-                if hasattr(button, 'clicked'):
-                    button.clicked.connect(self.show_not_implemented)
+        for button_name in NOT_IMPLEMENTED_BUTTONS:
+            button = self._widgets.get(button_name)
+            if isinstance(button, QAbstractButton):
+                button.clicked.connect(self.show_not_implemented)
     
     def load_solutions_tree(self):
         """Load solutions tree"""
         try:
-            self.solutionsTree.clear()
-            
             import importlib.util
             
             # Dynamic import of root_solution_manager
@@ -205,38 +260,57 @@ class LetsDoSolutionGUI(QMainWindow):
             manager = root_solution_manager.get_root_manager()
             solutions_info = manager.get_all_solutions_info()
             
-            for name, info in solutions_info.items():
-                item = QTreeWidgetItem(self.solutionsTree)
-                item.setText(0, name)
+            tree = self.solutionsTree
+            tree.setUpdatesEnabled(False)
+            tree.blockSignals(True)
+            try:
+                # Drop rows of solutions that are no longer registered
+                for name in [n for n in self._tree_items if n not in solutions_info]:
+                    item = self._tree_items.pop(name)
+                    tree.takeTopLevelItem(tree.indexOfTopLevelItem(item))
                 
-                status_icon = "✅" if info["status"] == "active" else "⏸️"
-                item.setText(1, status_icon)
-                item.setText(2, info["solution_type"])
+                # Update existing rows in place, insert new ones in one batch
+                new_items = []
+                for name, info in solutions_info.items():
+                    item = self._tree_items.get(name)
+                    if item is None:
+                        item = QTreeWidgetItem([name])
+                        self._tree_items[name] = item
+                        new_items.append(item)
+                    self._update_solution_item(item, info)
                 
-                # Set color based on status
-                if info["status"] == "active":
-                    item.setBackground(0, Qt.green)
-                else:
-                    item.setBackground(0, Qt.gray)
+                if new_items:
+                    tree.addTopLevelItems(new_items)
+            finally:
+                tree.blockSignals(False)
+                tree.setUpdatesEnabled(True)
             
             self.log_message("📋 Solutions tree updated")
             
         except Exception as e:
             self.log_message(f"❌ Error loading tree: {e}")
     
+    def _update_solution_item(self, item, info):
+        """Refresh status columns of a solutions tree row"""
+        is_active = info["status"] == "active"
+        item.setText(1, "✅" if is_active else "⏸️")
+        item.setText(2, info["solution_type"])
+        
+        # Set color based on status
+        item.setBackground(0, ACTIVE_STATUS_BRUSH if is_active else INACTIVE_STATUS_BRUSH)
+    
     def run_solution_operation(self, operation):
         """Run solution operation in separate thread"""
         self.log_message(f"🔄 Running operation: {operation}")
         self.statusLabel.setText(f"Status: Executing {operation}")
         self.progressBar.setValue(50)
         
-        # Create and start thread
-        worker = SolutionWorker(operation)
-        worker.log_signal.connect(self.log_message)
-        worker.finished_signal.connect(self.on_operation_finished)
+        # Create task and hand it to the pool
+        worker = SolutionWorker(operation, stop_event=self._stop_event)
+        worker.signals.log_signal.connect(self.log_message)
+        worker.signals.finished_signal.connect(self.on_operation_finished)
         
-        self.workers.append(worker)  # Save reference
-        worker.start()
+        self.pool.start(worker)
     
     def on_operation_finished(self, success, message):
         """Handle operation completion"""
@@ -265,20 +339,21 @@ class LetsDoSolutionGUI(QMainWindow):
             manager = root_solution_manager.get_root_manager()
             solutions_info = manager.get_all_solutions_info()
             
-            info_text = "📋 Solutions information:\n"
-            info_text += "=" * 40 + "\n\n"
-            
+            parts = ["📋 Solutions information:\n", "=" * 40 + "\n\n"]
+            active_count = 0
+
             for name, info in solutions_info.items():
-                status_icon = "✅" if info["status"] == "active" else "⏸️"
-                info_text += f"{status_icon} {name}:\n"
-                info_text += f"   Description: {info['description']}\n"
-                info_text += f"   Type: {info['solution_type']}\n"
-                info_text += f"   Status: {info['status']}\n\n"
-            
-            active_count = len([s for s in solutions_info.values() if s["status"] == "active"])
-            info_text += f"📊 Active solutions: {active_count}/{len(solutions_info)}"
-            
-            self.logTextEdit.setText(info_text)
+                is_active = info["status"] == "active"
+                active_count += is_active
+                status_icon = "✅" if is_active else "⏸️"
+                parts.append(f"{status_icon} {name}:\n")
+                parts.append(f"   Description: {info['description']}\n")
+                parts.append(f"   Type: {info['solution_type']}\n")
+                parts.append(f"   Status: {info['status']}\n\n")
+
+            parts.append(f"📊 Active solutions: {active_count}/{len(solutions_info)}")
+
+            self.logTextEdit.setText("".join(parts))
             self.log_message("📋 Solutions information loaded")
             
         except Exception as e:
@@ -308,23 +383,32 @@ class LetsDoSolutionGUI(QMainWindow):
     
     def log_message(self, message):
         """Add message to log"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}"
+        timestamp = time.strftime(LOG_TIMESTAMP_FORMAT)
+        self._log_buffer.append(f"[{timestamp}] {message}")
+        
+        if not self._log_timer.isActive():
+            self._log_timer.start(LOG_FLUSH_INTERVAL_MS)
+    
+    def _flush_log(self):
+        """Write buffered log messages to the log widget"""
+        if not self._log_buffer:
+            return
+        
+        batch = "\n".join(self._log_buffer)
+        self._log_buffer.clear()
         
         # Add to text field
-        self.logTextEdit.append(log_entry)
+        self.logTextEdit.append(batch)
         
         # Scroll to end
-        scrollbar = self.logTextEdit.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        self.logTextEdit.moveCursor(QTextCursor.End)
     
     def closeEvent(self, event):
         """Handle window close event"""
-        # Stop all threads
-        for worker in self.workers:
-            if worker.isRunning():
-                worker.terminate()
-                worker.wait()
+        # Ask tasks to stop, drop queued ones and wait briefly for running ones
+        self._stop_event.set()
+        self.pool.clear()
+        self.pool.waitForDone(500)
         
         event.accept()
 
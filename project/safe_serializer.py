@@ -22,12 +22,25 @@ MAX_SOLUTIONS = 10000
 JSON_VERSION = "1.0"
 FORMAT_NAME = "TheSolution_JSON"
 
+# Serialized SolutionCoordinate fields
+COORDINATE_FIELDS = ('x', 'y', 'z', 'a', 'b', 'c')
+
+# Serialized SolutionDimensions fields
+DIMENSION_FIELDS = ('width', 'height', 'depth', 'radius')
+
+# I/O constants
+IO_BUFFER_SIZE = 1024 * 1024  # 1MB
+
 class SolutionJSONEncoder:
     """Converts Solution objects to JSON-compatible dictionaries"""
     
     @staticmethod
-    def solution_to_dict(solution) -> Dict[str, Any]:
-        """Convert Solution object to dictionary"""
+    def solution_to_dict(solution, timestamp: Optional[str] = None) -> Dict[str, Any]:
+        """Convert Solution object to dictionary
+
+        timestamp is used as created_at for solutions that carry none;
+        project_to_dict passes one value for the whole project.
+        """
         try:
             if hasattr(solution, 'to_dict'):
                 # Use object's own serialization method if available
@@ -39,15 +52,7 @@ class SolutionJSONEncoder:
             
             # Handle SolutionCoordinate
             if hasattr(solution, 'x') and hasattr(solution, 'y') and hasattr(solution, 'z'):
-                return {
-                    'type': 'SolutionCoordinate',
-                    'x': float(solution.x),
-                    'y': float(solution.y),
-                    'z': float(solution.z),
-                    'a': float(getattr(solution, 'a', 0.0)),
-                    'b': float(getattr(solution, 'b', 0.0)),
-                    'c': float(getattr(solution, 'c', 0.0))
-                }
+                return SolutionJSONEncoder.coordinate_to_dict(solution)
             
             # Handle Solution objects
             if hasattr(solution, 'properties') and hasattr(solution, 'dimensions'):
@@ -65,40 +70,45 @@ class SolutionJSONEncoder:
                 }
                 
                 # Handle SolutionIndex objects in properties
-                if hasattr(solution.properties, 'index') and solution.properties.index is not None:
-                    data['metadata']['index'] = str(solution.properties.index)
+                index = getattr(solution.properties, 'index', None)
+                if index is not None:
+                    data['metadata']['index'] = str(index)
                 
                 # Add dimensions
-                if hasattr(solution.dimensions, 'width'):
-                    data['dimensions']['width'] = float(solution.dimensions.width)
-                if hasattr(solution.dimensions, 'height'):
-                    data['dimensions']['height'] = float(solution.dimensions.height)
-                if hasattr(solution.dimensions, 'depth'):
-                    data['dimensions']['depth'] = float(solution.dimensions.depth)
-                if hasattr(solution.dimensions, 'radius'):
-                    data['dimensions']['radius'] = float(solution.dimensions.radius)
+                dimensions = data['dimensions']
+                for field in DIMENSION_FIELDS:
+                    value = getattr(solution.dimensions, field, None)
+                    if value is not None:
+                        dimensions[field] = float(value)
                 
                 # Add material
-                if hasattr(solution.properties, 'material') and solution.properties.material:
+                material = getattr(solution.properties, 'material', None)
+                if material:
                     data['material'] = {
-                        'name': getattr(solution.properties.material, 'name', 'Unknown'),
-                        'density': float(getattr(solution.properties.material, 'density', 0.0))
+                        'name': getattr(material, 'name', 'Unknown'),
+                        'density': float(getattr(material, 'density', 0.0))
                     }
                 
                 # Add metadata
+                solution_id = getattr(solution, 'id', None)
+                created_at = getattr(solution, 'created_at', None)
+                if created_at is None:
+                    created_at = timestamp or datetime.now().isoformat()
                 data['metadata'] = {
-                    'created_at': getattr(solution, 'created_at', datetime.now().isoformat()),
+                    'created_at': created_at,
                     'version': getattr(solution, 'version', '1.0'),
-                    'id': str(getattr(solution, 'id', None)) if getattr(solution, 'id', None) is not None else None
+                    'id': str(solution_id) if solution_id is not None else None
                 }
                 
                 # Handle parent/children relationships
-                if hasattr(solution, 'parent') and solution.parent:
-                    parent_id = getattr(solution.parent, 'id', None)
+                parent = getattr(solution, 'parent', None)
+                if parent:
+                    parent_id = getattr(parent, 'id', None)
                     data['parent_id'] = str(parent_id) if parent_id is not None else None
                 
-                if hasattr(solution, 'children') and solution.children:
-                    children_ids = [getattr(child, 'id', None) for child in solution.children]
+                children = getattr(solution, 'children', None)
+                if children:
+                    children_ids = [getattr(child, 'id', None) for child in children]
                     data['children_ids'] = [str(child_id) if child_id is not None else None for child_id in children_ids]
                 
                 return data
@@ -121,23 +131,11 @@ class SolutionJSONEncoder:
     
     @staticmethod
     def coordinate_to_dict(coordinate) -> Dict[str, Any]:
-        """Convert SolutionCoordinate to dictionary"""
-        if not coordinate:
-            return {
-                'type': 'SolutionCoordinate',
-                'x': 0.0, 'y': 0.0, 'z': 0.0, 
-                'a': 0.0, 'b': 0.0, 'c': 0.0
-            }
-        
-        return {
-            'type': 'SolutionCoordinate',
-            'x': float(getattr(coordinate, 'x', 0.0)),
-            'y': float(getattr(coordinate, 'y', 0.0)),
-            'z': float(getattr(coordinate, 'z', 0.0)),
-            'a': float(getattr(coordinate, 'a', 0.0)),
-            'b': float(getattr(coordinate, 'b', 0.0)),
-            'c': float(getattr(coordinate, 'c', 0.0))
-        }
+        """Convert SolutionCoordinate to dictionary (missing values become 0.0)"""
+        data = {'type': 'SolutionCoordinate'}
+        for field in COORDINATE_FIELDS:
+            data[field] = float(getattr(coordinate, field, 0.0))
+        return data
     
     @staticmethod
     def project_to_dict(solutions: List, metadata: Dict = None) -> Dict[str, Any]:
@@ -145,11 +143,13 @@ class SolutionJSONEncoder:
         if not metadata:
             metadata = {}
         
+        created_at = datetime.now().isoformat()
+        
         # Convert solutions to dictionaries
         solutions_data = []
         for solution in solutions:
             try:
-                solution_dict = SolutionJSONEncoder.solution_to_dict(solution)
+                solution_dict = SolutionJSONEncoder.solution_to_dict(solution, created_at)
                 solutions_data.append(solution_dict)
             except Exception as e:
                 logger.error(f"Error serializing solution: {e}")
@@ -164,7 +164,7 @@ class SolutionJSONEncoder:
         project_data = {
             'format': FORMAT_NAME,
             'version': JSON_VERSION,
-            'created_at': datetime.now().isoformat(),
+            'created_at': created_at,
             'metadata': {
                 'name': metadata.get('name', 'TheSolution Project'),
                 'description': metadata.get('description', ''),
@@ -207,14 +207,7 @@ class SolutionJSONDecoder:
         try:
             from solution_data_types import SolutionCoordinate
             
-            return SolutionCoordinate(
-                x=data.get('x', 0.0),
-                y=data.get('y', 0.0),
-                z=data.get('z', 0.0),
-                a=data.get('a', 0.0),
-                b=data.get('b', 0.0),
-                c=data.get('c', 0.0)
-            )
+            return SolutionCoordinate(**{field: data.get(field, 0.0) for field in COORDINATE_FIELDS})
         except ImportError:
             logger.error("solution_data_types not available")
             return None
@@ -223,33 +216,20 @@ class SolutionJSONDecoder:
     def dict_to_solution_object(data: Dict[str, Any], parent=None):
         """Create Solution object from dictionary"""
         try:
-            from solution_data_types import SolutionType, SolutionDataUtils, SolutionCoordinate, SolutionMaterial
+            from solution_data_types import SolutionType, SolutionDataUtils, SolutionMaterial
             
             # Create base solution
             solution_type_str = data.get('solution_type', 'BOX')
             try:
                 solution_type = SolutionType(solution_type_str)
             except ValueError:
-                # Handle case-insensitive mapping
-                solution_type_str_upper = solution_type_str.upper()
-                if solution_type_str_upper == 'BOX':
-                    solution_type = SolutionType.BOX
-                elif solution_type_str_upper == 'SPHERE':
-                    solution_type = SolutionType.SPHERE
-                elif solution_type_str_upper == 'CYLINDER':
-                    solution_type = SolutionType.CYLINDER
-                else:
-                    solution_type = SolutionType.BOX  # Default fallback
-            
-            coordinate_data = data.get('coordinate', {})
-            coordinate = SolutionCoordinate(
-                x=coordinate_data.get('x', 0.0),
-                y=coordinate_data.get('y', 0.0),
-                z=coordinate_data.get('z', 0.0),
-                a=coordinate_data.get('a', 0.0),
-                b=coordinate_data.get('b', 0.0),
-                c=coordinate_data.get('c', 0.0)
-            )
+                # Handle case-insensitive mapping via the enum member table
+                solution_type = SolutionType.__members__.get(
+                    str(solution_type_str).upper(),
+                    SolutionType.BOX  # Default fallback
+                )
+            
+            coordinate = SolutionJSONDecoder.dict_to_coordinate(data.get('coordinate', {}))
             
             solution = SolutionDataUtils.create_minimal_solution_data(
                 name=data.get('name', 'Unnamed'),
@@ -259,14 +239,9 @@ class SolutionJSONDecoder:
             
             # Set dimensions
             dimensions = data.get('dimensions', {})
-            if 'width' in dimensions:
-                solution.dimensions.width = float(dimensions['width'])
-            if 'height' in dimensions:
-                solution.dimensions.height = float(dimensions['height'])
-            if 'depth' in dimensions:
-                solution.dimensions.depth = float(dimensions['depth'])
-            if 'radius' in dimensions:
-                solution.dimensions.radius = float(dimensions['radius'])
+            for field in DIMENSION_FIELDS:
+                if field in dimensions:
+                    setattr(solution.dimensions, field, float(dimensions[field]))
             
             # Set material
             material_data = data.get('material', {})
@@ -339,8 +314,14 @@ class SafeProjectManager:
     """Main API for saving/loading projects"""
     
     @staticmethod
-    def save_project(solutions: List, filename: str, metadata: Dict = None) -> bool:
-        """Save project to JSON file"""
+    def save_project(solutions: List, filename: str, metadata: Dict = None,
+                     compact: bool = False) -> bool:
+        """Save project to JSON file
+
+        With compact=True the file is written without indentation, which is
+        noticeably faster and smaller for large projects. load_project reads
+        both layouts.
+        """
         try:
             # Validate input
             if not solutions:
@@ -353,9 +334,15 @@ class SafeProjectManager:
             # Create project data
             project_data = SolutionJSONEncoder.project_to_dict(solutions, metadata)
             
-            # Save to file
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(project_data, f, indent=2, ensure_ascii=False)
+            # Serialize in memory and save with a single write
+            if compact:
+                payload = json.dumps(project_data, separators=(',', ':'), ensure_ascii=False)
+            else:
+                payload = json.dumps(project_data, indent=2, ensure_ascii=False)
+            
+            with open(filename, 'w', encoding='utf-8', newline='\n',
+                      buffering=IO_BUFFER_SIZE) as f:
+                f.write(payload)
             
             logger.info(f"Project saved successfully: {filename}")
             return True
@@ -368,13 +355,14 @@ class SafeProjectManager:
     def load_project(filename: str) -> List:
         """Load project from JSON file"""
         try:
-            # Validate file
-            if not SafeProjectManager.validate_project_file(filename):
+            # Read and validate the file in one pass
+            raw = SafeProjectManager._read_project_bytes(filename)
+            if raw is None:
                 raise ValueError("Invalid project file")
             
-            # Load JSON
-            with open(filename, 'r', encoding='utf-8') as f:
-                project_data = json.load(f)
+            # Parse JSON from the raw bytes; json decodes UTF-8 itself, which
+            # skips the text-mode decoding layer and its extra copy
+            project_data = json.loads(raw)
             
             # Convert to solutions
             solutions = SolutionJSONDecoder.dict_to_project(project_data)
@@ -386,6 +374,26 @@ class SafeProjectManager:
             logger.error(f"Error loading project: {e}")
             return []
     
+    @staticmethod
+    def _check_file_limits(filename: str, file_size: int) -> bool:
+        """Size and extension rules shared by validation and loading"""
+        if file_size > MAX_FILE_SIZE:
+            logger.error(f"File too large: {file_size} > {MAX_FILE_SIZE}")
+            return False
+        
+        if not filename.lower().endswith(('.json', '.3d_sol')):
+            logger.warning(f"Unexpected file extension: {filename}")
+        
+        return True
+    
+    @staticmethod
+    def _check_format_header(filename: str, head: bytes) -> bool:
+        """Check that the first 1024 bytes of the file name the project format"""
+        if FORMAT_NAME.encode() not in head[:1024]:
+            logger.error(f"Invalid format in file: {filename}")
+            return False
+        return True
+    
     @staticmethod
     def validate_project_file(filename: str) -> bool:
         """Validate project file without loading"""
@@ -394,43 +402,55 @@ class SafeProjectManager:
             if not os.path.exists(filename):
                 return False
             
-            # Check file size
-            file_size = os.path.getsize(filename)
-            if file_size > MAX_FILE_SIZE:
-                logger.error(f"File too large: {file_size} > {MAX_FILE_SIZE}")
+            if not SafeProjectManager._check_file_limits(filename, os.path.getsize(filename)):
                 return False
             
-            # Check file extension
-            if not filename.lower().endswith(('.json', '.3d_sol')):
-                logger.warning(f"Unexpected file extension: {filename}")
-            
-            # Try to parse JSON header
+            # Only the header is read to check the format
             try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    # Read first few lines to check format
-                    header = f.read(1024)
-                    if FORMAT_NAME not in header:
-                        logger.error(f"Invalid format in file: {filename}")
-                        return False
+                with open(filename, 'rb') as f:
+                    head = f.read(1024)
             except Exception as e:
                 logger.error(f"Error reading file {filename}: {e}")
                 return False
             
-            return True
+            return SafeProjectManager._check_format_header(filename, head)
             
         except Exception as e:
             logger.error(f"Error validating file {filename}: {e}")
             return False
     
+    @staticmethod
+    def _read_project_bytes(filename: str) -> Optional[bytes]:
+        """Read project file once and apply the validate_project_file checks to it"""
+        try:
+            file_size = os.path.getsize(filename)
+        except OSError:
+            return None
+        
+        if not SafeProjectManager._check_file_limits(filename, file_size):
+            return None
+        
+        try:
+            with open(filename, 'rb') as f:
+                raw = f.read()
+        except Exception as e:
+            logger.error(f"Error reading file {filename}: {e}")
+            return None
+        
+        if not SafeProjectManager._check_format_header(filename, raw):
+            return None
+        
+        return raw
+    
     @staticmethod
     def get_project_info(filename: str) -> Dict[str, Any]:
         """Get project information without loading all data"""
         try:
-            if not SafeProjectManager.validate_project_file(filename):
+            raw = SafeProjectManager._read_project_bytes(filename)
+            if raw is None:
                 return {}
             
-            with open(filename, 'r', encoding='utf-8') as f:
-                project_data = json.load(f)
+            project_data = json.loads(raw)
             
             return {
                 'format': project_data.get('format'),
@@ -438,7 +458,7 @@ class SafeProjectManager:
                 'created_at': project_data.get('created_at'),
                 'metadata': project_data.get('metadata', {}),
                 'solutions_count': len(project_data.get('solutions', [])),
-                'file_size': os.path.getsize(filename)
+                'file_size': len(raw)
             }
             
         except Exception as e: